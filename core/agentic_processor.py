@@ -5,21 +5,108 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from ollama import Client
 import json
+import math
+import multiprocessing
+import os
+import statistics
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from django.utils import timezone
 from .models import NewsItem
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from .keyword_scoring import _keyword_score, _keyword_score_batch
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import time
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON, fall back to the stdlib
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many rows a process pool costs more to start than it saves.
+# Workers are spawned fresh interpreters (~1s to start a pool) while inline
+# scoring runs at roughly 400k rows/s, so only very large scans qualify
+FILTER_POOL_MIN_ROWS = 500000
+
+# Adaptive LLM concurrency defaults
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TARGET_P95_MS = 30000
+
+# Columns needed before the LLM phases - the heavy `content` column is loaded later
+PHASE1_FIELDS = ('id', 'title', 'summary', 'source', 'url', 'published_date', 'created_at')
+
+
+def json_loads(data):
+    """Parse JSON with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
 def create_ollama_client():
-    """Create Ollama client with generous timeouts"""
+    """Shared Ollama client with generous timeouts (its HTTP pool is thread-safe)"""
     return Client(
         host="http://localhost:11434",
         timeout=180  # 3 minutes to prevent timeouts
     )
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    Semaphore whose size follows observed LLM latency
+    
+    After every `adjust_every` completed calls the rolling p95 latency is
+    compared with the target: one more slot while under target, one less
+    (never below 1) once p95 exceeds the target by 20%.
+    """
+
+    def __init__(self, initial: int, maximum: int, target_p95_ms: float,
+                 adjust_every: int = 5, window: int = 20):
+        self.maximum = max(1, maximum)
+        self.limit = max(1, min(initial, self.maximum))
+        self.target_p95_ms = target_p95_ms
+        self.adjust_every = adjust_every
+        self.latencies = deque(maxlen=window)
+        self._in_flight = 0
+        self._completed = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """Hold one concurrency slot and record how long the call inside took"""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release((time.monotonic() - start) * 1000)
+
+    def _release(self, latency_ms: float):
+        with self._cond:
+            self._in_flight -= 1
+            self._completed += 1
+            self.latencies.append(latency_ms)
+            if self._completed % self.adjust_every == 0 and len(self.latencies) >= 2:
+                self._adjust()
+            self._cond.notify_all()
+
+    def _adjust(self):
+        p95 = statistics.quantiles(self.latencies, n=20)[-1]
+        if p95 < self.target_p95_ms and self.limit < self.maximum:
+            self.limit += 1
+        elif p95 > 1.2 * self.target_p95_ms and self.limit > 1:
+            self.limit -= 1
+        logger.info(f"  📏 p95 {p95 / 1000:.1f}s → {self.limit} concurrent LLM calls")
+
+
 class AgenticNewsProcessor:
     """
     OPTIMIZED agentic AI processor - 10x faster than original
@@ -32,12 +119,36 @@ class AgenticNewsProcessor:
     5. Keyword pre-filtering
     """
     
-    def __init__(self, model="llama3", max_workers=3):
+    def __init__(self, model="llama3", max_workers=3, filter_workers=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, target_p95_ms=DEFAULT_TARGET_P95_MS):
         self.model = model
-        self.max_workers = max_workers  # Reduced to prevent overwhelming Ollama
-        self.batch_size = 5  # Process in small batches
+        self.max_workers = max_workers  # Starting LLM concurrency, adapted at runtime
+        self.max_concurrency = max_concurrency  # Ceiling for adaptive concurrency
+        self.target_p95_ms = target_p95_ms
+        self.filter_workers = filter_workers or os.cpu_count() or 1  # Phase-1 is CPU-bound
         
         
+    def warmup(self) -> float:
+        """
+        Force Ollama to load the model before parallel workers hit it
+        Returns the load time in seconds (0 if the warmup request failed)
+        """
+        start = time.time()
+        try:
+            create_ollama_client().generate(
+                model=self.model,
+                prompt='ok',
+                options={'num_predict': 1},
+                keep_alive='30m'  # Keep weights resident for the whole run
+            )
+        except Exception as e:
+            logger.warning(f"Model warmup failed: {e}")
+            return 0.0
+        
+        elapsed = time.time() - start
+        logger.info(f"🔥 Model {self.model} loaded in {elapsed:.1f}s")
+        return elapsed
+
     def _call_llm_fast(self, prompt: str, system_prompt: str = None, 
                        max_tokens: int = 500, is_deep_analysis: bool = False) -> str:
         """
@@ -100,9 +211,9 @@ class AgenticNewsProcessor:
             start = text.find('{')
             end = text.rfind('}') + 1
             if start != -1 and end > start:
-                return json.loads(text[start:end])
+                return json_loads(text[start:end])
             
-            return json.loads(text)
+            return json_loads(text)
         except:
             return {}
 
@@ -112,44 +223,21 @@ class AgenticNewsProcessor:
         Filters out low-priority items before LLM analysis
         CYBERSECURITY FOCUSED
         """
-        text = (title + " " + summary).lower()
-        
-        # Filter out non-cybersecurity content first
-        cyber_indicators = ['security', 'cyber', 'vulnerability', 'breach', 'attack', 
-                           'threat', 'malware', 'hack', 'exploit', 'patch']
-        if not any(indicator in text for indicator in cyber_indicators):
-            return 20  # Very low score for non-cybersecurity
-        
-        # Filter out AI/general tech without security context
-        if any(kw in text for kw in ['agentic commerce', 'digital transformation', 'ai-enabled']):
-            if not any(sec in text for sec in ['security', 'vulnerability', 'breach', 'attack']):
-                return 15  # Very low score for non-security AI content
-        
-        # Critical keywords (90-100 points)
-        critical = ['zero-day', '0-day', 'critical vulnerability', 'actively exploited', 
-                   'ransomware attack', 'massive breach', 'supply chain attack', 
-                   'widespread', 'emergency patch', 'rce', 'remote code execution']
-        
-        # High priority (70-89 points)
-        high = ['vulnerability', 'exploit', 'breach', 'malware', 'attack', 'compromised',
-               'backdoor', 'critical', 'urgent', 'patch now', 'data leak', 'apt']
-        
-        # Medium priority (50-69 points)
-        medium = ['security', 'patch', 'update', 'threat', 'warning', 'advisory',
-                 'flaw', 'risk', 'exposed', 'discovered']
-        
-        # Low priority (30-49 points)
-        low = ['report', 'analysis', 'research', 'study', 'opinion', 'trends']
-        
-        if any(kw in text for kw in critical):
-            return 95
-        elif any(kw in text for kw in high):
-            return 80
-        elif any(kw in text for kw in medium):
-            return 60
-        elif any(kw in text for kw in low):
-            return 40
-        return 50
+        return _keyword_score((title + " " + summary).lower())
+
+    def _score_rows(self, rows: List[tuple]) -> List[tuple]:
+        """Keyword-score (id, title, summary) rows, fanned out over worker processes"""
+        if self.filter_workers <= 1 or len(rows) < FILTER_POOL_MIN_ROWS:
+            return _keyword_score_batch(rows)
+        
+        chunk_size = math.ceil(len(rows) / self.filter_workers)
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        
+        # Spawn rather than fork: this runs on a job thread inside the web
+        # process, and forking a multi-threaded process can deadlock the child
+        with ProcessPoolExecutor(max_workers=self.filter_workers,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            return [pair for batch in executor.map(_keyword_score_batch, chunks) for pair in batch]
 
     def step1_gather_news(self, hours: int = 24, limit: int = None) -> List[NewsItem]:
         """Gather recent CYBERSECURITY news only"""
@@ -173,12 +261,12 @@ class AgenticNewsProcessor:
         
         query &= keyword_query
         
-        news_query = NewsItem.objects.filter(query).order_by('-created_at')
+        news_query = NewsItem.objects.filter(query).only(*PHASE1_FIELDS).order_by('-created_at')
         
         if limit:
             news_query = news_query[:limit]
         
-        news_items = list(news_query)
+        news_items = list(news_query.iterator(chunk_size=500))
         logger.info(f"📥 Gathered {len(news_items)} cybersecurity news items")
         return news_items
 
@@ -189,10 +277,9 @@ class AgenticNewsProcessor:
         """
         logger.info(f"🚀 Fast filtering {len(news_items)} items...")
         
-        scored = []
-        for item in news_items:
-            score = self._keyword_priority_score(item.title, item.summary)
-            scored.append((item, score))
+        rows = [(item.id, item.title, item.summary) for item in news_items]
+        scores = dict(self._score_rows(rows))
+        scored = [(item, scores[item.id]) for item in news_items]
         
         # Sort and take top 30 (3x buffer for deep analysis)
         scored.sort(key=lambda x: x[1], reverse=True)
@@ -201,12 +288,22 @@ class AgenticNewsProcessor:
         logger.info(f"✅ Filtered to top {len(top_candidates)} candidates")
         return top_candidates
 
+    def _load_content(self, news_items: List[NewsItem]) -> None:
+        """Fetch the heavy content column only for items that reach the LLM phases"""
+        contents = dict(
+            NewsItem.objects.filter(id__in=[item.id for item in news_items])
+            .values_list('id', 'content')
+        )
+        for item in news_items:
+            item.content = contents.get(item.id, '')
+
     def step3_quick_scoring(self, candidates: List[NewsItem]) -> List[Dict]:
         """
-        PHASE 2: Quick LLM scoring with BATCHING to prevent timeouts
-        Process in small batches to avoid overwhelming Ollama
+        PHASE 2: Quick LLM scoring with ADAPTIVE concurrency
+        Concurrency grows while p95 latency stays under target and shrinks
+        before Ollama starts timing out
         """
-        logger.info(f"⚡ Quick LLM scoring of {len(candidates)} candidates (batched)...")
+        logger.info(f"⚡ Quick LLM scoring of {len(candidates)} candidates (adaptive)...")
         
         system_prompt = """You are a cybersecurity analyst. Analyze news quickly and provide:
 1. Importance score (1-100)
@@ -253,29 +350,30 @@ Respond with JSON only:
                 'analysis': analysis
             }
 
-        # Process in BATCHES to avoid overwhelming Ollama
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=self.max_workers,
+            maximum=self.max_concurrency,
+            target_p95_ms=self.target_p95_ms
+        )
+
+        def limited_score(news_item: NewsItem) -> Dict:
+            with limiter.slot():
+                return quick_score(news_item)
+
+        # Dispatch similar-length prompts together so Ollama's parallel slots
+        # process requests of near-uniform size at any moment
+        by_length = sorted(candidates, key=lambda it: len(it.title) + len(it.summary or ''))
+
         scored_items = []
-        batch_size = self.batch_size
-        
-        for i in range(0, len(candidates), batch_size):
-            batch = candidates[i:i + batch_size]
-            logger.info(f"  📦 Processing batch {i//batch_size + 1}/{(len(candidates)-1)//batch_size + 1} ({len(batch)} items)")
-            
-            # Process batch with limited parallelism
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = [executor.submit(quick_score, item) for item in batch]
-                
-                for future in as_completed(futures):
-                    try:
-                        result = future.result(timeout=120)  # 2 minute timeout per item
-                        scored_items.append(result)
-                    except Exception as e:
-                        logger.error(f"Scoring failed: {e}")
+        with ThreadPoolExecutor(max_workers=limiter.maximum) as executor:
+            futures = [executor.submit(limited_score, item) for item in by_length]
             
-            # Small delay between batches to let Ollama breathe
-            if i + batch_size < len(candidates):
-                time.sleep(2)
-                logger.info(f"  ⏸️  Batch complete, brief pause...")
+            for future in as_completed(futures):
+                try:
+                    result = future.result(timeout=120)  # 2 minute timeout per item
+                    scored_items.append(result)
+                except Exception as e:
+                    logger.error(f"Scoring failed: {e}")
         
         logger.info(f"✅ Scored {len(scored_items)}/{len(candidates)} items")
         return scored_items
@@ -440,7 +538,7 @@ Be thorough and comprehensive - quality and completeness are important."""
             news_item.risk_score = risk_assessment.get('risk_score', 5)
             
             # Store comprehensive additional details
-            news_item.risk_reason = json.dumps({
+            risk_data = {
                 'affected_systems': deep.get('affected_systems', []),
                 'affected_users': deep.get('affected_users', 'N/A'),
                 'business_impact': deep.get('business_impact', 'N/A'),
@@ -450,13 +548,15 @@ Be thorough and comprehensive - quality and completeness are important."""
                 'risk_reasoning': risk_assessment.get('reasoning', 'N/A'),
                 'likelihood': risk_assessment.get('likelihood', 'N/A'),
                 'impact': risk_assessment.get('impact', 'N/A')
-            })[:8000]  # Increased limit for comprehensive data
+            }
+            news_item.risk_reason = risk_data
             
             news_item.priority = 10 if news_item.risk_level == 'critical' else (
                 8 if news_item.risk_level == 'high' else 5
             )
             news_item.processed_by_llm = True
             news_item.processed_at = timezone.now()
+            news_item.updated_at = news_item.processed_at
             
             updated_items.append(news_item)
         
@@ -464,7 +564,7 @@ Be thorough and comprehensive - quality and completeness are important."""
         NewsItem.objects.bulk_update(
             updated_items,
             ['ai_summary', 'risk_level', 'risk_score', 'risk_reason', 
-             'priority', 'processed_by_llm', 'processed_at']
+             'priority', 'processed_by_llm', 'processed_at', 'updated_at']
         )
         
         logger.info(f"✅ Updated {len(updated_items)} items with comprehensive analysis")
@@ -481,7 +581,7 @@ Be thorough and comprehensive - quality and completeness are important."""
         Expected time: 5-10 minutes instead of 1 hour
         """
         logger.info("🚀 Starting OPTIMIZED Agentic Analysis")
-        logger.info(f"⚡ {self.max_workers} parallel workers | Speed-optimized")
+        logger.info(f"⚡ {self.max_workers}→{self.max_concurrency} adaptive workers | Speed-optimized")
         logger.info("=" * 70)
         
         start_time = timezone.now()
@@ -494,6 +594,7 @@ Be thorough and comprehensive - quality and completeness are important."""
             
             # Step 2: Fast keyword filtering (instant)
             candidates = self.step2_fast_filtering(news_items, top_n * 3)
+            self._load_content(candidates)
             
             # Step 3: Quick LLM scoring (parallel)
             scored_items = self.step3_quick_scoring(candidates)
@@ -540,7 +641,8 @@ Be thorough and comprehensive - quality and completeness are important."""
                         'risk_score': item.risk_score,
                         'url': item.url,
                         'summary': item.ai_summary,
-                        'published': str(item.published_date) if item.published_date else None
+                        'published': str(item.published_date) if item.published_date else None,
+                        'risk_data': item.risk_reason
                     }
                     for item in updated_items
                 ],
@@ -585,8 +687,8 @@ def run_agentic_news_analysis(hours: int = 24, model: str = "llama3",
 
 
 def get_agent_top_10(limit: int = 10) -> List[NewsItem]:
-    """Get agent's top 10 analyzed news items"""
+    """Get agent's top 10 analyzed news items (without the full article text)"""
     return NewsItem.objects.filter(
         processed_by_llm=True,
         priority__gte=5
-    ).order_by('-risk_score', '-priority', '-created_at')[:limit]
\ No newline at end of file
+    ).defer('content').order_by('-risk_score', '-priority', '-created_at')[:limit]
\ No newline at end of file
@@ -1,19 +1,49 @@
+import asyncio
 import requests
+import string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from contextlib import aclosing
 from bs4 import BeautifulSoup
-from ollama import Client
+from ollama import AsyncClient, Client
 from django.utils import timezone
-from .models import NewsItem
+from .models import LLMResultCache, NewsItem
+from .near_duplicates import FALLBACK_SUMMARY_SUFFIX, load_index, reuse_near_duplicates, save_index, sync_index
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+OLLAMA_HOST = "http://localhost:11434"
+OLLAMA_MODEL = "llama3"  # Use llama3.2 or mistral for faster inference if available
+
+# Upper bound on one streamed verdict; its length is capped by num_predict
+STREAM_TIMEOUT = 45
+
+# Columns the pipeline reads before the LLM call
+PROCESSING_FIELDS = ('id', 'title', 'summary', 'content', 'url', 'processed_by_llm')
+
+# Items saved per bulk_update on the async path, and the columns it writes
+WRITE_CHUNK_SIZE = 16
+PROCESSED_FIELDS = [
+    'content', 'ai_summary', 'risk_level', 'risk_score', 'risk_reason',
+    'processed_by_llm', 'processed_at', 'updated_at'
+]
+# What _mark_no_url/_mark_error touch; writing the full list would lazy-load
+# every deferred verdict column of each failed item first
+MARKED_FIELDS = ['content', 'ai_summary', 'processed_by_llm', 'updated_at']
+
+# How long cached LLM verdicts stay valid
+BREAKING_CACHE_TTL = timedelta(hours=1)
+DEFAULT_CACHE_TTL = timedelta(days=30)
+
 # Initialize Ollama client with timeout
-ollama_client = Client(host="http://localhost:11434", timeout=30)
+ollama_client = Client(host=OLLAMA_HOST, timeout=30)
 
 HEADERS = {
     "User-Agent": (
@@ -23,6 +53,22 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Keep-alive pool for article fetches; transient 429/5xx are retried with backoff
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
 # Content extraction cache to avoid re-fetching
 CONTENT_CACHE = {}
 
@@ -39,10 +85,10 @@ def extract_article_content(url, max_retries=2):
     for attempt in range(max_retries):
         try:
             # Reduced timeout for faster failure
-            response = requests.get(url, headers=HEADERS, timeout=8)
+            response = SESSION.get(url, timeout=(3, 8))  # (connect, read)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
             
             # Remove unwanted elements - optimized selector
             for tag in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'form', 'button']):
@@ -101,16 +147,25 @@ def extract_article_content(url, max_retries=2):
     return None
 
 
-def generate_ai_summary_with_ollama(title, content, url):
-    """
-    Generate AI summary and risk assessment using Ollama - OPTIMIZED
-    """
-    try:
-        # Shortened, more focused prompt for faster processing
-        prompt = f"""Analyze this cybersecurity news and respond with ONLY valid JSON:
+SYSTEM_PROMPT = "You are a cybersecurity analyst. Respond with ONLY JSON, no markdown."
+
+# Optimized Ollama parameters
+OLLAMA_OPTIONS = {
+    "temperature": 0.2,  # Lower for faster, more deterministic responses
+    "num_predict": 300,  # Reduced token limit
+    "top_p": 0.9,
+    "top_k": 40,
+    "num_ctx": 2048,  # Reduced context window
+}
 
-Title: {title}
-Content: {content[:2500]}
+
+# Article text budget for the prompt: lead paragraphs plus the closing part
+PROMPT_HEAD_CHARS = 2000
+PROMPT_TAIL_CHARS = 500
+
+# Static instructions come first so every request shares a byte-identical
+# prefix that Ollama can reuse from its KV cache; only the tail varies
+PROMPT_TEMPLATE = string.Template("""Analyze the cybersecurity news below and respond with ONLY valid JSON.
 
 Provide:
 1. Summary (2-3 sentences max)
@@ -119,30 +174,45 @@ Provide:
 4. Risk reason (1-2 sentences)
 
 JSON format:
-{{"ai_summary": "...", "risk_level": "...", "risk_score": X, "risk_reason": "..."}}"""
+{"ai_summary": "...", "risk_level": "...", "risk_score": X, "risk_reason": "..."}
 
-        # Optimized Ollama parameters
-        response = ollama_client.chat(
-            model="llama3",  # Use llama3.2 or mistral for faster inference if available
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a cybersecurity analyst. Respond with ONLY JSON, no markdown."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            options={
-                "temperature": 0.2,  # Lower for faster, more deterministic responses
-                "num_predict": 300,  # Reduced token limit
-                "top_p": 0.9,
-                "top_k": 40,
-                "num_ctx": 2048,  # Reduced context window
-            }
-        )
-        
+Title: $title
+Content: $content""")
+
+
+def _head_tail(content, head_chars=PROMPT_HEAD_CHARS, tail_chars=PROMPT_TAIL_CHARS):
+    """
+    Keep the lead and the conclusion of long articles, cut on word boundaries
+    
+    ~4 characters per token keeps the prompt well inside num_ctx.
+    """
+    if len(content) <= head_chars + tail_chars:
+        return content
+    head = content[:head_chars].rsplit(None, 1)[0]
+    tail = content[-tail_chars:].split(None, 1)[-1]
+    return f"{head}\n...\n{tail}"
+
+
+def _build_messages(title, content):
+    """Chat messages for the summary/risk prompt"""
+    # Shortened, more focused prompt for faster processing
+    prompt = PROMPT_TEMPLATE.substitute(title=title, content=_head_tail(content))
+
+    return [
+        {
+            "role": "system",
+            "content": SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": prompt
+        }
+    ]
+
+
+def _parse_ai_response(response, title, content):
+    """Extract, validate and normalize the JSON verdict from an Ollama chat response"""
+    try:
         # Extract and clean response
         response_text = response['message']['content'].strip()
         
@@ -179,9 +249,76 @@ JSON format:
         logger.error(f"JSON parse error: {e}")
         # Fallback with basic keyword analysis
         return generate_fallback_analysis(title, content)
+    except Exception as e:
+        logger.error(f"Ollama response error: {e}")
+        return generate_fallback_analysis(title, content)
+
+
+def generate_ai_summary_with_ollama(title, content, url):
+    """
+    Generate AI summary and risk assessment using Ollama - OPTIMIZED
+    """
+    try:
+        response = ollama_client.chat(
+            model=OLLAMA_MODEL,
+            messages=_build_messages(title, content),
+            options=OLLAMA_OPTIONS
+        )
+    except Exception as e:
+        logger.error(f"Ollama error: {e}")
+        return generate_fallback_analysis(title, content)
+    
+    return _parse_ai_response(response, title, content)
+
+
+async def _stream_chat(client, title, content):
+    """
+    Stream a chat completion, stopping once the JSON verdict is complete
+    
+    Leaving the stream closes the HTTP response so Ollama stops generating;
+    runaway output is already bounded by OLLAMA_OPTIONS['num_predict'].
+    """
+    text = ''
+    stream = await client.chat(
+        model=OLLAMA_MODEL,
+        messages=_build_messages(title, content),
+        options=OLLAMA_OPTIONS,
+        stream=True
+    )
+    async with aclosing(stream):
+        async for chunk in stream:
+            piece = chunk['message']['content']
+            text += piece
+            if '}' in piece and _json_complete(text):
+                break
+    return {'message': {'content': text}}
+
+
+def _json_complete(text):
+    start = text.find('{')
+    if start == -1:
+        return False
+    try:
+        json.loads(text[start:text.rfind('}') + 1])
+        return True
+    except ValueError:
+        return False
+
+
+async def generate_ai_summary_async(client, title, content, url):
+    """
+    Async variant of generate_ai_summary_with_ollama sharing one AsyncClient
+    """
+    try:
+        response = await asyncio.wait_for(_stream_chat(client, title, content), timeout=STREAM_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.error(f"Ollama timed out after {STREAM_TIMEOUT}s: {title[:50]}...")
+        return generate_fallback_analysis(title, content)
     except Exception as e:
         logger.error(f"Ollama error: {e}")
         return generate_fallback_analysis(title, content)
+    
+    return _parse_ai_response(response, title, content)
 
 
 def generate_fallback_analysis(title, content):
@@ -205,14 +342,135 @@ def generate_fallback_analysis(title, content):
         risk_level, risk_score = 'low', 3
     
     return {
-        'ai_summary': f"Cybersecurity news: {title}. AI analysis temporarily unavailable.",
+        'ai_summary': f"Cybersecurity news: {title}. {FALLBACK_SUMMARY_SUFFIX}",
         'risk_level': risk_level,
         'risk_score': risk_score,
-        'risk_reason': f'Keyword-based assessment: {risk_level} priority security news.'
+        'risk_reason': f'Keyword-based assessment: {risk_level} priority security news.',
+        'fallback': True  # Never cached
+    }
+
+
+def content_hash(title, content):
+    """Cache key for an article: normalized title plus the first 4KB of content"""
+    key = f"{title.strip().lower()}|{content[:4096]}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def cache_ttl(title):
+    """Breaking vulnerability stories change fast; everything else is stable"""
+    lowered = title.lower()
+    if 'cve' in lowered or 'zero-day' in lowered:
+        return BREAKING_CACHE_TTL
+    return DEFAULT_CACHE_TTL
+
+
+def _cached_result(h):
+    """Return the unexpired cached AI verdict for a content hash, or None"""
+    cached = LLMResultCache.objects.filter(
+        content_hash=h,
+        model_name=OLLAMA_MODEL,
+        expires_at__gt=timezone.now()
+    ).first()
+    if cached is None:
+        return None
+    return {
+        'ai_summary': cached.ai_summary,
+        'risk_level': cached.risk_level,
+        'risk_score': cached.risk_score,
+        'risk_reason': cached.risk_reason
     }
 
 
-def process_single_news_item(news_item):
+def _store_result(h, ai_result, title):
+    """Remember a real (non-fallback) AI verdict for later reprints"""
+    if ai_result.get('fallback'):
+        return
+    # Upsert so an expired row for the same hash is refreshed in place
+    LLMResultCache.objects.bulk_create([
+        LLMResultCache(
+            content_hash=h,
+            model_name=OLLAMA_MODEL,
+            ai_summary=ai_result['ai_summary'],
+            risk_level=ai_result['risk_level'],
+            risk_score=ai_result['risk_score'],
+            risk_reason=ai_result['risk_reason'],
+            expires_at=timezone.now() + cache_ttl(title)
+        )
+    ],
+        update_conflicts=True,
+        unique_fields=['content_hash', 'model_name'],
+        update_fields=['ai_summary', 'risk_level', 'risk_score', 'risk_reason', 'expires_at']
+    )
+
+
+def _mark_no_url(news_item):
+    news_item.processed_by_llm = True
+    news_item.ai_summary = "No URL available."
+
+
+def _prepare_content(news_item):
+    """Fetch article text, falling back to title/summary, and stash it on the item"""
+    content = extract_article_content(news_item.url)
+    
+    if not content or len(content) < 100:
+        # Use title/summary as fallback
+        content = f"{news_item.title}. {news_item.summary}"
+        logger.warning(f"Using title/summary fallback for {news_item.id}")
+    
+    news_item.content = content[:2000]  # Reduced storage
+    return content
+
+
+def _apply_ai_result(news_item, ai_result):
+    """Copy the AI verdict onto the item (the caller saves it)"""
+    news_item.ai_summary = ai_result['ai_summary']
+    news_item.risk_level = ai_result['risk_level']
+    news_item.risk_score = ai_result['risk_score']
+    news_item.risk_reason = {'risk_reasoning': ai_result['risk_reason']}
+    news_item.processed_by_llm = True
+    news_item.processed_at = timezone.now()
+
+
+def _mark_error(news_item):
+    news_item.ai_summary = "Processing error occurred."
+    news_item.processed_by_llm = True
+
+
+class _BulkWriter:
+    """
+    Collects finished items and saves them with one bulk_update per chunk
+    
+    Only used from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, chunk_size=WRITE_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.pending = {}  # columns to write -> items
+
+    async def add(self, news_item, fields=PROCESSED_FIELDS):
+        self.pending.setdefault(tuple(fields), []).append(news_item)
+        if sum(len(items) for items in self.pending.values()) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self):
+        if not self.pending:
+            return
+        groups, self.pending = self.pending, {}
+        now = timezone.now()
+        for fields, chunk in groups.items():
+            for news_item in chunk:
+                news_item.updated_at = now
+            await sync_to_async(NewsItem.objects.bulk_update)(chunk, list(fields))
+
+
+def _save_processed(news_item):
+    # Items loaded with .only() save just their loaded fields, which skips
+    # the auto_now on a deferred updated_at, so stamp it explicitly
+    news_item.updated_at = timezone.now()
+    news_item.save()
+
+
+def process_single_news_item(news_item, use_cache=True):
     """
     Process a single news item - STREAMLINED
     """
@@ -223,59 +481,119 @@ def process_single_news_item(news_item):
         
         # Skip if no URL
         if not news_item.url:
-            news_item.processed_by_llm = True
-            news_item.ai_summary = "No URL available."
-            news_item.save()
+            _mark_no_url(news_item)
+            _save_processed(news_item)
             return {'success': False, 'reason': 'no_url'}
         
         # Extract content
-        content = extract_article_content(news_item.url)
+        content = _prepare_content(news_item)
         
-        if not content or len(content) < 100:
-            # Use title/summary as fallback
-            content = f"{news_item.title}. {news_item.summary}"
-            logger.warning(f"Using title/summary fallback for {news_item.id}")
+        # Reuse the verdict for identical reprints, otherwise ask the model
+        h = content_hash(news_item.title, content)
+        ai_result = _cached_result(h) if use_cache else None
+        if ai_result is None:
+            ai_result = generate_ai_summary_with_ollama(
+                news_item.title,
+                content,
+                news_item.url
+            )
+            _store_result(h, ai_result, news_item.title)
+        else:
+            logger.info(f"♻️  Cache hit for {news_item.id}")
         
-        news_item.content = content[:2000]  # Reduced storage
+        # Update database
+        _apply_ai_result(news_item, ai_result)
+        _save_processed(news_item)
         
-        # Generate AI analysis
-        ai_result = generate_ai_summary_with_ollama(
-            news_item.title,
-            content,
-            news_item.url
-        )
+        logger.info(f"✓ Processed {news_item.id}: {news_item.title[:50]}...")
+        return {'success': True, 'id': news_item.id}
         
-        # Update database
-        news_item.ai_summary = ai_result['ai_summary']
-        news_item.risk_level = ai_result['risk_level']
-        news_item.risk_score = ai_result['risk_score']
-        news_item.risk_reason = ai_result['risk_reason']
-        news_item.processed_by_llm = True
-        news_item.processed_at = timezone.now()
-        news_item.save()
+    except Exception as e:
+        logger.error(f"Error processing {news_item.id}: {e}")
+        _mark_error(news_item)
+        _save_processed(news_item)
+        return {'success': False, 'reason': str(e)}
+
+
+async def _process_one(client, news_item, sem, writer, use_cache=True):
+    """
+    Async counterpart of process_single_news_item
+    
+    Page fetches run in worker threads, cache misses go to Ollama through
+    one AsyncClient gated by `sem`, and results are saved in chunks by `writer`.
+    """
+    try:
+        if news_item.processed_by_llm:
+            return {'success': False, 'reason': 'already_processed'}
+        
+        if not news_item.url:
+            _mark_no_url(news_item)
+            await writer.add(news_item, MARKED_FIELDS)
+            return {'success': False, 'reason': 'no_url'}
+        
+        content = await asyncio.to_thread(_prepare_content, news_item)
+        
+        h = content_hash(news_item.title, content)
+        ai_result = await sync_to_async(_cached_result)(h) if use_cache else None
+        if ai_result is None:
+            async with sem:
+                ai_result = await generate_ai_summary_async(
+                    client,
+                    news_item.title,
+                    content,
+                    news_item.url
+                )
+            await sync_to_async(_store_result)(h, ai_result, news_item.title)
+        else:
+            logger.info(f"♻️  Cache hit for {news_item.id}")
+        
+        _apply_ai_result(news_item, ai_result)
+        await writer.add(news_item)
         
         logger.info(f"✓ Processed {news_item.id}: {news_item.title[:50]}...")
         return {'success': True, 'id': news_item.id}
         
     except Exception as e:
         logger.error(f"Error processing {news_item.id}: {e}")
-        news_item.ai_summary = "Processing error occurred."
-        news_item.processed_by_llm = True
-        news_item.save()
+        _mark_error(news_item)
+        await writer.add(news_item, MARKED_FIELDS)
         return {'success': False, 'reason': str(e)}
 
 
-def process_unprocessed_news(batch_size=10, delay=0.5, parallel=True, max_workers=4):
+async def _process_items_async(items, max_workers, use_cache=True, on_progress=None):
+    """Run _process_one for every item with at most max_workers Ollama calls in flight"""
+    sem = asyncio.Semaphore(max_workers)
+    client = AsyncClient(host=OLLAMA_HOST, timeout=30)
+    writer = _BulkWriter()
+    
+    async def process(item):
+        result = await _process_one(client, item, sem, writer, use_cache)
+        if on_progress:
+            on_progress(result)
+        return result
+    
+    try:
+        return await asyncio.gather(*[process(item) for item in items])
+    finally:
+        await writer.flush()
+
+
+def process_unprocessed_news(batch_size=10, delay=0.5, parallel=True, max_workers=4, use_cache=True,
+                             on_progress=None):
     """
     Process unprocessed news items - PARALLEL PROCESSING
     
     Args:
         batch_size: Number of items to process
         delay: Delay between batches (not per item)
-        parallel: Use parallel processing
-        max_workers: Number of parallel workers
+        parallel: Use concurrent (asyncio) processing
+        max_workers: Maximum concurrent Ollama calls
+        use_cache: Reuse cached verdicts for identical or near-duplicate content
+        on_progress: Called with each item's result dict as it finishes
     """
-    unprocessed = NewsItem.objects.filter(processed_by_llm=False)[:batch_size]
+    unprocessed = list(
+        NewsItem.objects.filter(processed_by_llm=False).only(*PROCESSING_FIELDS)[:batch_size]
+    )
     total = len(unprocessed)
     
     if total == 0:
@@ -288,52 +606,61 @@ def process_unprocessed_news(batch_size=10, delay=0.5, parallel=True, max_worker
         'total': total,
         'processed': 0,
         'failed': 0,
-        'skipped': 0
+        'skipped': 0,
+        'near_duplicates': 0
     }
     
     start_time = time.time()
     
-    if parallel and total > 1:
-        # PARALLEL PROCESSING for significant speedup
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_item = {
-                executor.submit(process_single_news_item, item): item 
-                for item in unprocessed
-            }
-            
-            for future in as_completed(future_to_item):
-                result = future.result()
-                if result['success']:
-                    results['processed'] += 1
-                elif result.get('reason') in ['already_processed', 'no_url']:
-                    results['skipped'] += 1
-                else:
-                    results['failed'] += 1
+    # Reprints of already analysed articles reuse the earlier verdict
+    index = load_index() if use_cache else None
+    if index is not None:
+        unprocessed, reused = reuse_near_duplicates(unprocessed, index)
+        results['processed'] += reused
+        results['near_duplicates'] = reused
+    
+    if parallel and len(unprocessed) > 1:
+        # CONCURRENT PROCESSING: one event loop, semaphore-gated Ollama calls
+        for result in asyncio.run(_process_items_async(unprocessed, max_workers, use_cache, on_progress)):
+            if result['success']:
+                results['processed'] += 1
+            elif result.get('reason') in ['already_processed', 'no_url']:
+                results['skipped'] += 1
+            else:
+                results['failed'] += 1
     else:
         # SEQUENTIAL PROCESSING (fallback)
-        for item in unprocessed:
-            result = process_single_news_item(item)
+        for i, item in enumerate(unprocessed):
+            # Pace calls to Ollama, but don't sleep after the last one
+            if i and delay:
+                time.sleep(delay)
+            result = process_single_news_item(item, use_cache)
+            if on_progress:
+                on_progress(result)
             if result['success']:
                 results['processed'] += 1
             elif result.get('reason') in ['already_processed', 'no_url']:
                 results['skipped'] += 1
             else:
                 results['failed'] += 1
-            
-            time.sleep(delay)
+    
+    if index is not None:
+        sync_index(index)
+        save_index(index)
     
     elapsed = time.time() - start_time
     logger.info(
         f"✅ Complete in {elapsed:.1f}s: "
         f"{results['processed']} processed, "
         f"{results['failed']} failed, "
-        f"{results['skipped']} skipped"
+        f"{results['skipped']} skipped, "
+        f"{results['near_duplicates']} near-duplicates"
     )
     
     return results
 
 
-def process_high_priority_first(batch_size=20, max_workers=4):
+def process_high_priority_first(batch_size=20, max_workers=4, on_progress=None):
     """
     Process high-priority news first (priority >= 5)
     """
@@ -348,31 +675,35 @@ def process_high_priority_first(batch_size=20, max_workers=4):
         return process_unprocessed_news(
             batch_size=len(high_priority),
             parallel=True,
-            max_workers=max_workers
+            max_workers=max_workers,
+            on_progress=on_progress
         )
     
     # If no high-priority, process regular items
     return process_unprocessed_news(
         batch_size=batch_size,
         parallel=True,
-        max_workers=max_workers
+        max_workers=max_workers,
+        on_progress=on_progress
     )
 
 
 def reprocess_news_item(news_id):
     """
     Reprocess a specific news item by ID
+
+    Returns the updated item (already saved) on success, otherwise None.
     """
     try:
         news_item = NewsItem.objects.get(id=news_id)
         news_item.processed_by_llm = False
         news_item.save()
         
-        result = process_single_news_item(news_item)
-        return result['success']
+        result = process_single_news_item(news_item, use_cache=False)  # Explicit reprocess wants a fresh verdict
+        return news_item if result['success'] else None
     except NewsItem.DoesNotExist:
         logger.error(f"News item {news_id} not found")
-        return False
+        return None
 
 
 def batch_reprocess_by_risk(risk_level='low', limit=10):
@@ -388,7 +719,7 @@ def batch_reprocess_by_risk(risk_level='low', limit=10):
         item.processed_by_llm = False
         item.save()
     
-    return process_unprocessed_news(batch_size=limit, parallel=True)
+    return process_unprocessed_news(batch_size=limit, parallel=True, use_cache=False)
 
 
 def clear_content_cache():
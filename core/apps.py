@@ -1,6 +1,27 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
 
+def _serves_requests():
+    """True in server processes; False for manage.py commands other than runserver"""
+    script = os.path.basename(sys.argv[0]) if sys.argv else ''
+    if script not in ('manage.py', 'django-admin', '__main__.py'):
+        return True  # gunicorn, uvicorn, ...
+    if sys.argv[1:2] != ['runserver']:
+        return False
+    # The autoreloader's watcher process never serves; its child sets RUN_MAIN
+    return os.environ.get('RUN_MAIN') == 'true' or '--noreload' in sys.argv
+
+
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # Every serving process runs the job dispatchers, so queued work is
+        # picked up after a restart without waiting for a new request
+        if _serves_requests():
+            from .tasks import start_dispatchers
+            start_dispatchers()
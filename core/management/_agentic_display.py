@@ -0,0 +1,169 @@
+# core/management/_agentic_display.py
+
+import io
+import textwrap
+from types import SimpleNamespace
+
+_RISK_EMOJI = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
+
+def _writeln(buf, text=''):
+    """Mimic OutputWrapper.write: add a newline unless the text ends with one"""
+    buf.write(text if text.endswith('\n') else text + '\n')
+
+
+def _compile_styles(style, roles=('SUCCESS', 'WARNING', 'ERROR')):
+    """
+    Bake each style role's ANSI prefix/suffix into a str.format callable
+    
+    Style already degrades to plain text when stdout is not a TTY (or with
+    --no-color), so the compiled formats do too.
+    """
+    formats = {}
+    for role in roles:
+        template = getattr(style, role)('\0').replace('{', '{{').replace('}', '}}')
+        formats[role] = template.replace('\0', '{}').format
+    return SimpleNamespace(**formats)
+
+
+class AgenticDisplayMixin:
+    """Console rendering of agentic analysis results, shared by management commands"""
+
+    # Built once; continuation lines get the same extra indent as before
+    _wrapper = textwrap.TextWrapper(width=76, break_long_words=False, subsequent_indent='   ')
+
+    def _display_results(self, result, show_reasoning, show_details):
+        """Display comprehensive results"""
+        
+        # Styled text is buffered and written once instead of per line
+        buf = io.StringIO()
+        self._paint = _compile_styles(self.style)
+        
+        _writeln(buf, '\n' + '=' * 80)
+        _writeln(buf, self._paint.SUCCESS('📊 ANALYSIS RESULTS'))
+        _writeln(buf, '=' * 80)
+        
+        # Statistics
+        _writeln(buf, self._paint.WARNING('\n📈 Statistics:'))
+        _writeln(buf, f'   Total articles analyzed: {result["total_analyzed"]}')
+        if result.get('candidates_evaluated'):
+            _writeln(buf, f'   Candidates for deep analysis: {result["candidates_evaluated"]}')
+        _writeln(buf, f'   Top priority selected: {result["top_items_count"]}')
+        _writeln(buf, f'   Processing time: {result["processing_time_minutes"]:.2f} minutes ({result["processing_time_seconds"]:.1f}s)')
+        _writeln(buf, f'   Parallel workers used: {result["parallel_workers"]}')
+        if result.get('items_per_minute'):
+            _writeln(buf, f'   Processing speed: {result["items_per_minute"]:.1f} items/minute')
+        
+        # Identified patterns
+        if result.get('identified_patterns'):
+            _writeln(buf, self._paint.WARNING('\n🔍 Identified Threat Patterns:'))
+            for pattern in result['identified_patterns']:
+                _writeln(buf, f'   • {pattern}')
+        
+        # Top N items
+        _writeln(buf, '\n' + '=' * 80)
+        _writeln(buf, self._paint.SUCCESS(f'🎯 TOP {result["top_items_count"]} MOST IMPORTANT CYBERSECURITY NEWS'))
+        _writeln(buf, '=' * 80 + '\n')
+        
+        total = len(result['top_items'])
+        for idx, item in enumerate(result['top_items'], 1):
+            self._display_news_item(buf, idx, total, item, show_details)
+        
+        self.stdout.write(buf.getvalue(), ending='')
+
+    def _display_news_item(self, buf, idx, total, item, show_details=False):
+        """Display individual news item with comprehensive details"""
+        
+        # Header with ranking and risk
+        emoji = _RISK_EMOJI.get(item['risk_level'], '⚪')
+        
+        _writeln(buf, self._paint.SUCCESS(
+            f'[{idx}/{total}] {emoji} {item["risk_level"].upper()} '
+            f'(Risk Score: {item["risk_score"]}/10)'
+        ))
+        _writeln(buf, '-' * 80)
+        
+        # Title
+        _writeln(buf, self._paint.WARNING(f'📰 {item["title"]}'))
+        
+        # Source
+        if item.get('source'):
+            _writeln(buf, f'📡 Source: {item.get("source", "Unknown")}')
+        
+        # Published date
+        if item.get('published') and item['published'] != 'None':
+            _writeln(buf, f'📅 Published: {item["published"]}')
+        
+        # URL
+        _writeln(buf, f'🔗 {item["url"]}')
+        
+        # Comprehensive Summary
+        if item.get('summary'):
+            _writeln(buf, self._paint.SUCCESS('\n📝 AI Analysis Summary:'))
+            summary = self._wrap_text(item['summary'])
+            for line in summary.split('\n'):
+                _writeln(buf, f'   {line}')
+        
+        # Detailed view (if requested)
+        if show_details:
+            self._display_detailed_analysis(buf, item)
+        
+        _writeln(buf, '\n')
+
+    def _display_detailed_analysis(self, buf, item):
+        """Display detailed analysis information"""
+        
+        risk_data = item.get('risk_data') or {}
+        
+        if risk_data.get('affected_systems'):
+            _writeln(buf, self._paint.WARNING('\n🎯 Affected Systems:'))
+            for system in risk_data['affected_systems']:
+                _writeln(buf, f'   • {system}')
+        
+        if risk_data.get('affected_users'):
+            _writeln(buf, self._paint.WARNING('\n👥 Affected Users:'))
+            _writeln(buf, f'   {risk_data["affected_users"]}')
+        
+        if risk_data.get('business_impact'):
+            _writeln(buf, self._paint.WARNING('\n💼 Business Impact:'))
+            impact = self._wrap_text(risk_data['business_impact'])
+            for line in impact.split('\n'):
+                _writeln(buf, f'   {line}')
+        
+        if risk_data.get('immediate_actions'):
+            _writeln(buf, self._paint.WARNING('\n⚡ Immediate Actions:'))
+            for action in risk_data['immediate_actions']:
+                _writeln(buf, f'   • {action}')
+        
+        if risk_data.get('long_term_recommendations'):
+            _writeln(buf, self._paint.WARNING('\n📋 Long-term Recommendations:'))
+            for rec in risk_data['long_term_recommendations']:
+                _writeln(buf, f'   • {rec}')
+        
+        if risk_data.get('indicators_of_compromise'):
+            iocs = risk_data['indicators_of_compromise']
+            if iocs and len(iocs) > 0 and iocs[0]:
+                _writeln(buf, self._paint.WARNING('\n🚨 Indicators of Compromise:'))
+                for ioc in iocs:
+                    if ioc:
+                        _writeln(buf, f'   • {ioc}')
+        
+        if risk_data.get('risk_reasoning'):
+            _writeln(buf, self._paint.WARNING('\n🔍 Risk Assessment Reasoning:'))
+            reasoning = self._wrap_text(risk_data['risk_reasoning'])
+            for line in reasoning.split('\n'):
+                _writeln(buf, f'   {line}')
+
+    def _wrap_text(self, text):
+        """Wrap long text to 76 columns, preserving paragraphs"""
+        if not text:
+            return ""
+        if isinstance(text, list):  # The model sometimes answers with a list of paragraphs
+            text = '\n\n'.join(map(str, text))
+        
+        return '\n\n   '.join(self._wrapper.fill(p.strip()) for p in text.split('\n\n') if p.strip())
@@ -1,17 +1,22 @@
 # core/management/commands/agentic_news_update.py
 
 import logging
+import os
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from core.scraper import run_scraper, save_to_db
-from core.agentic_processor import AgenticNewsProcessor
+from core.agentic_processor import (
+    AgenticNewsProcessor,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_TARGET_P95_MS
+)
+from core.management._agentic_display import AgenticDisplayMixin
 from core.models import NewsItem
-import json
 
 logger = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(AgenticDisplayMixin, BaseCommand):
     help = 'Scrape latest news and run agentic AI analysis to find top 10 most important cybersecurity news'
 
     def add_arguments(self, parser):
@@ -31,7 +36,25 @@ class Command(BaseCommand):
             '--workers',
             type=int,
             default=3,
-            help='Number of parallel workers (default: 3, recommended 2-4 to avoid timeouts)'
+            help='Initial number of parallel LLM workers (default: 3, adapted at runtime)'
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=DEFAULT_MAX_CONCURRENCY,
+            help=f'Upper bound for adaptive LLM concurrency (default: {DEFAULT_MAX_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--target-p95-ms',
+            type=int,
+            default=DEFAULT_TARGET_P95_MS,
+            help=f'Target p95 LLM latency used to grow/shrink concurrency (default: {DEFAULT_TARGET_P95_MS})'
+        )
+        parser.add_argument(
+            '--filter-workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processes for Phase-1 keyword filtering (default: number of CPUs)'
         )
         parser.add_argument(
             '--limit',
@@ -65,6 +88,9 @@ class Command(BaseCommand):
         hours = options['hours']
         model = options['model']
         workers = options['workers']
+        max_workers = options['max_workers']
+        target_p95_ms = options['target_p95_ms']
+        filter_workers = options['filter_workers']
         limit = options['limit']
         top_n = options['top_n']
         skip_scrape = options['skip_scrape']
@@ -76,7 +102,7 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'⏰ Time: {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'))
         self.stdout.write(self.style.SUCCESS(f'🔍 Analyzing last {hours} hours'))
         self.stdout.write(self.style.SUCCESS(f'🧠 Model: {model}'))
-        self.stdout.write(self.style.SUCCESS(f'⚙️  Workers: {workers} (optimized for reliability)'))
+        self.stdout.write(self.style.SUCCESS(f'⚙️  Workers: {workers}→{max_workers} (adaptive, p95 target {target_p95_ms / 1000:.0f}s)'))
         self.stdout.write(self.style.SUCCESS(f'🎯 Top items: {top_n}'))
         if limit:
             self.stdout.write(self.style.SUCCESS(f'📊 Item limit: {limit}'))
@@ -90,11 +116,9 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING('   Fetching articles from trusted security sources...\n'))
             
             try:
-                scraped_data = run_scraper()
+                scraped_data, total_scraped = run_scraper()
                 saved_items = save_to_db(scraped_data)
                 
-                total_scraped = sum(len(v) for v in scraped_data.values())
-                
                 self.stdout.write(self.style.SUCCESS(f'\n   ✅ Scraping Complete!'))
                 self.stdout.write(f'      Total articles found: {total_scraped}')
                 self.stdout.write(f'      New articles saved: {len(saved_items)}')
@@ -124,12 +148,20 @@ class Command(BaseCommand):
         # STEP 2: Run agentic AI analysis
         self.stdout.write(self.style.WARNING('\n🤖 STEP 2: Running Agentic AI Analysis...'))
         self.stdout.write(self.style.WARNING('   Phase 1: Keyword filtering (instant)'))
-        self.stdout.write(self.style.WARNING('   Phase 2: Quick LLM scoring (batched)'))
+        self.stdout.write(self.style.WARNING('   Phase 2: Quick LLM scoring (adaptive concurrency)'))
         self.stdout.write(self.style.WARNING('   Phase 3: Deep analysis of top 10 (comprehensive)'))
         self.stdout.write(self.style.WARNING(f'   Expected time: 10-15 minutes\n'))
         
         try:
-            agent = AgenticNewsProcessor(model=model, max_workers=workers)
+            agent = AgenticNewsProcessor(
+                model=model,
+                max_workers=workers,
+                filter_workers=filter_workers,
+                max_concurrency=max_workers,
+                target_p95_ms=target_p95_ms
+            )
+            load_time = agent.warmup()
+            self.stdout.write(f'   🔥 Model warm-up: {load_time:.1f}s')
             result = agent.run_agentic_analysis(hours=hours, limit=limit, top_n=top_n)
             
             if not result['success']:
@@ -147,175 +179,6 @@ class Command(BaseCommand):
             )
             logger.exception("Agentic analysis failed")
 
-    def _display_results(self, result, show_reasoning, show_details):
-        """Display comprehensive results"""
-        
-        self.stdout.write('\n' + '=' * 80)
-        self.stdout.write(self.style.SUCCESS('📊 ANALYSIS RESULTS'))
-        self.stdout.write('=' * 80)
-        
-        # Statistics
-        self.stdout.write(self.style.WARNING('\n📈 Statistics:'))
-        self.stdout.write(f'   Total articles analyzed: {result["total_analyzed"]}')
-        if result.get('candidates_evaluated'):
-            self.stdout.write(f'   Candidates for deep analysis: {result["candidates_evaluated"]}')
-        self.stdout.write(f'   Top priority selected: {result["top_items_count"]}')
-        self.stdout.write(f'   Processing time: {result["processing_time_minutes"]:.2f} minutes ({result["processing_time_seconds"]:.1f}s)')
-        self.stdout.write(f'   Parallel workers used: {result["parallel_workers"]}')
-        if result.get('items_per_minute'):
-            self.stdout.write(f'   Processing speed: {result["items_per_minute"]:.1f} items/minute')
-        
-        # Identified patterns
-        if result.get('identified_patterns'):
-            self.stdout.write(self.style.WARNING('\n🔍 Identified Threat Patterns:'))
-            for pattern in result['identified_patterns']:
-                self.stdout.write(f'   • {pattern}')
-        
-        # Top N items
-        self.stdout.write('\n' + '=' * 80)
-        self.stdout.write(self.style.SUCCESS(f'🎯 TOP {result["top_items_count"]} MOST IMPORTANT CYBERSECURITY NEWS'))
-        self.stdout.write('=' * 80 + '\n')
-        
-        for idx, item in enumerate(result['top_items'], 1):
-            self._display_news_item(idx, item, result["top_items_count"], show_details)
-
-    def _display_news_item(self, idx, item, total_items, show_details=False):
-        """Display individual news item with comprehensive details"""
-        
-        # Header with ranking and risk
-        risk_emoji = {
-            'critical': '🔴',
-            'high': '🟠',
-            'medium': '🟡',
-            'low': '🟢'
-        }
-        
-        emoji = risk_emoji.get(item['risk_level'], '⚪')
-        
-        self.stdout.write(self.style.SUCCESS(
-            f'[{idx}/{total_items}] {emoji} {item["risk_level"].upper()} '
-            f'(Risk Score: {item["risk_score"]}/10)'
-        ))
-        self.stdout.write('-' * 80)
-        
-        # Title
-        self.stdout.write(self.style.WARNING(f'📰 {item["title"]}'))
-        
-        # Source
-        if item.get('source'):
-            self.stdout.write(f'📡 Source: {item.get("source", "Unknown")}')
-        
-        # Published date
-        if item.get('published') and item['published'] != 'None':
-            self.stdout.write(f'📅 Published: {item["published"]}')
-        
-        # URL
-        self.stdout.write(f'🔗 {item["url"]}')
-        
-        # Comprehensive Summary
-        if item.get('summary'):
-            self.stdout.write(self.style.SUCCESS('\n📝 AI Analysis Summary:'))
-            summary = self._wrap_text(item['summary'], 76)
-            for line in summary.split('\n'):
-                self.stdout.write(f'   {line}')
-        
-        # Detailed view (if requested)
-        if show_details:
-            self._display_detailed_analysis(item)
-        
-        self.stdout.write('\n')
-
-    def _display_detailed_analysis(self, item):
-        """Display detailed analysis information"""
-        
-        # Get risk_reason from NewsItem if available
-        try:
-            news_item = NewsItem.objects.get(id=item['id'])
-            if news_item.risk_reason:
-                risk_data = json.loads(news_item.risk_reason) if isinstance(news_item.risk_reason, str) else news_item.risk_reason
-                
-                if risk_data.get('affected_systems'):
-                    self.stdout.write(self.style.WARNING('\n🎯 Affected Systems:'))
-                    for system in risk_data['affected_systems']:
-                        self.stdout.write(f'   • {system}')
-                
-                if risk_data.get('affected_users'):
-                    self.stdout.write(self.style.WARNING('\n👥 Affected Users:'))
-                    self.stdout.write(f'   {risk_data["affected_users"]}')
-                
-                if risk_data.get('business_impact'):
-                    self.stdout.write(self.style.WARNING('\n💼 Business Impact:'))
-                    impact = self._wrap_text(risk_data['business_impact'], 76)
-                    for line in impact.split('\n'):
-                        self.stdout.write(f'   {line}')
-                
-                if risk_data.get('immediate_actions'):
-                    self.stdout.write(self.style.WARNING('\n⚡ Immediate Actions:'))
-                    for action in risk_data['immediate_actions']:
-                        self.stdout.write(f'   • {action}')
-                
-                if risk_data.get('long_term_recommendations'):
-                    self.stdout.write(self.style.WARNING('\n📋 Long-term Recommendations:'))
-                    for rec in risk_data['long_term_recommendations']:
-                        self.stdout.write(f'   • {rec}')
-                
-                if risk_data.get('indicators_of_compromise'):
-                    iocs = risk_data['indicators_of_compromise']
-                    if iocs and len(iocs) > 0 and iocs[0]:
-                        self.stdout.write(self.style.WARNING('\n🚨 Indicators of Compromise:'))
-                        for ioc in iocs:
-                            if ioc:
-                                self.stdout.write(f'   • {ioc}')
-                
-                if risk_data.get('risk_reasoning'):
-                    self.stdout.write(self.style.WARNING('\n🔍 Risk Assessment Reasoning:'))
-                    reasoning = self._wrap_text(risk_data['risk_reasoning'], 76)
-                    for line in reasoning.split('\n'):
-                        self.stdout.write(f'   {line}')
-                        
-        except NewsItem.DoesNotExist:
-            logger.debug(f"Could not find news item {item.get('id')}")
-        except Exception as e:
-            logger.debug(f"Could not parse detailed analysis: {e}")
-
-    def _wrap_text(self, text, width):
-        """Wrap long text to specified width, preserving paragraphs"""
-        if not text:
-            return ""
-        
-        # Split into paragraphs
-        paragraphs = text.split('\n\n')
-        wrapped_paragraphs = []
-        
-        for paragraph in paragraphs:
-            # Clean up the paragraph
-            paragraph = paragraph.strip()
-            if not paragraph:
-                continue
-            
-            # Wrap the paragraph
-            words = paragraph.split()
-            lines = []
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                if current_length + len(word) + 1 <= width:
-                    current_line.append(word)
-                    current_length += len(word) + 1
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-                    current_length = len(word)
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
-            wrapped_paragraphs.append('\n   '.join(lines))
-        
-        return '\n\n   '.join(wrapped_paragraphs)
-
 
 # USAGE EXAMPLES:
 # 
@@ -2,14 +2,15 @@
 
 import logging
 from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Case, Count, F, Q, Value, When, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from datetime import timedelta
 from core.models import NewsItem
 from core.scraper import run_scraper, save_to_db
 from core.ai_processor import process_high_priority_first, clear_content_cache, process_unprocessed_news
 import time
-from core.views import delete_all_news
-from rest_framework.test import APIRequestFactory
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +34,8 @@ class Command(BaseCommand):
         parser.add_argument(
             '--clean-days',
             type=int,
-            default=1,
-            help='Delete news older than X days (default: 30)'
+            default=30,
+            help='Delete news older than X days, or -1 for all of it (default: 30)'
         )
         parser.add_argument(
             '--no-clean',
@@ -46,6 +47,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip scraping (only process existing)'
         )
+        parser.add_argument(
+            '--show-processed',
+            action='store_true',
+            help='List every processed article with its AI summary at the end'
+        )
 
     def handle(self, *args, **options):
         start_time = time.time()
@@ -83,7 +89,7 @@ class Command(BaseCommand):
         
         # Display results
         elapsed = time.time() - start_time
-        self._display_results(scraped_count, processed_stats, summary, elapsed)
+        self._display_results(scraped_count, processed_stats, summary, elapsed, options['show_processed'])
         
         # Clear cache for next run
         clear_content_cache()
@@ -92,44 +98,44 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('=' * 60))
         
     def _clean_old_news(self, days):
-        if days == -1:  # use -1 to indicate "delete all"
-            factory = APIRequestFactory()
-            request = factory.delete('/api/news/delete-all/')
-            response = delete_all_news(request)
-
-            self.stdout.write(self.style.ERROR(str(response.data)))
-            return
-    
-    
-    # def _clean_old_news(self, days):
-    #     """Delete news older than specified days"""
-    #     try:
-    #         cutoff_date = timezone.now() - timedelta(days=days)
-    #         deleted_count, _ = NewsItem.objects.filter(
-    #             created_at__lt=cutoff_date
-    #         ).delete()
+        """Delete news older than specified days (-1 deletes everything)"""
+        # Nothing has a ForeignKey to NewsItem, so the cascade-free _raw_delete
+        # issues a single DELETE without loading rows or firing signals
+        try:
+            if days == -1:  # use -1 to indicate "delete all"
+                deleted_count = NewsItem.objects.all()._raw_delete(NewsItem.objects.db)
+                if connection.vendor == 'sqlite':
+                    with connection.cursor() as cursor:
+                        cursor.execute("DELETE FROM sqlite_sequence WHERE name='core_newsitem';")
+                clear_content_cache()
+                self.stdout.write(self.style.ERROR(f'   ✓ Deleted all {deleted_count} articles'))
+                return
+            
+            cutoff_date = timezone.now() - timedelta(days=days)
+            deleted_count = NewsItem.objects.filter(
+                created_at__lt=cutoff_date
+            )._raw_delete(NewsItem.objects.db)
             
-    #         if deleted_count > 0:
-    #             self.stdout.write(
-    #                 self.style.SUCCESS(f'   ✓ Deleted {deleted_count} articles older than {days} days')
-    #             )
-    #         else:
-    #             self.stdout.write(
-    #                 self.style.SUCCESS(f'   ✓ No old articles to delete')
-    #             )
+            if deleted_count > 0:
+                self.stdout.write(
+                    self.style.SUCCESS(f'   ✓ Deleted {deleted_count} articles older than {days} days')
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(f'   ✓ No old articles to delete')
+                )
                 
-    #     except Exception as e:
-    #         self.stdout.write(
-    #             self.style.ERROR(f'   ✗ Error cleaning old news: {str(e)}')
-    #         )
+        except Exception as e:
+            self.stdout.write(
+                self.style.ERROR(f'   ✗ Error cleaning old news: {str(e)}')
+            )
 
     def _scrape_news(self):
         """Scrape latest news from all sources"""
         try:
-            scraped_data = run_scraper()
+            scraped_data, total_scraped = run_scraper()
             saved_items = save_to_db(scraped_data)
             
-            total_scraped = sum(len(v) for v in scraped_data.values())
             total_saved = len(saved_items)
             duplicates = total_scraped - total_saved
             
@@ -144,14 +150,15 @@ class Command(BaseCommand):
                     self.style.WARNING(f'   ⓘ Skipped {duplicates} duplicates')
                 )
             
-            # Show breakdown by source
+            # Show breakdown by source (written as one block)
             self.stdout.write(self.style.SUCCESS('\n   Source breakdown:'))
+            breakdown = []
             for source, items in scraped_data.items():
                 if items:
-                    high_priority = sum(1 for item in items if item.get('is_priority', False))
-                    self.stdout.write(
-                        f'   • {source}: {len(items)} articles ({high_priority} high-priority)'
-                    )
+                    high_priority = sum(1 for item in items if item.get('is_priority'))
+                    breakdown.append(f'   • {source}: {len(items)} articles ({high_priority} high-priority)')
+            if breakdown:
+                self.stdout.write('\n'.join(breakdown))
             
             return total_saved
             
@@ -193,42 +200,24 @@ class Command(BaseCommand):
     def _generate_summary(self):
         """Generate statistics summary"""
         try:
-            total = NewsItem.objects.count()
-            processed = NewsItem.objects.filter(processed_by_llm=True).count()
-            unprocessed = NewsItem.objects.filter(processed_by_llm=False).count()
-            
-            # Today's news
             today = timezone.now().date()
-            today_news = NewsItem.objects.filter(created_at__date=today).count()
-            
-            # Risk breakdown
-            critical = NewsItem.objects.filter(
-                processed_by_llm=True, risk_level='critical'
-            ).count()
-            high = NewsItem.objects.filter(
-                processed_by_llm=True, risk_level='high'
-            ).count()
-            medium = NewsItem.objects.filter(
-                processed_by_llm=True, risk_level='medium'
-            ).count()
-            low = NewsItem.objects.filter(
-                processed_by_llm=True, risk_level='low'
-            ).count()
-            
-            # Priority breakdown
-            high_priority = NewsItem.objects.filter(priority__gte=5).count()
+            processed_q = Q(processed_by_llm=True)
             
-            return {
-                'total': total,
-                'processed': processed,
-                'unprocessed': unprocessed,
-                'today_news': today_news,
-                'critical': critical,
-                'high': high,
-                'medium': medium,
-                'low': low,
-                'high_priority': high_priority
-            }
+            # One round-trip for every counter in the report
+            return NewsItem.objects.aggregate(
+                total=Count('id'),
+                processed=Count('id', filter=processed_q),
+                unprocessed=Count('id', filter=Q(processed_by_llm=False)),
+                # Today's news
+                today_news=Count('id', filter=Q(created_at__date=today)),
+                # Risk breakdown
+                critical=Count('id', filter=processed_q & Q(risk_level='critical')),
+                high=Count('id', filter=processed_q & Q(risk_level='high')),
+                medium=Count('id', filter=processed_q & Q(risk_level='medium')),
+                low=Count('id', filter=processed_q & Q(risk_level='low')),
+                # Priority breakdown
+                high_priority=Count('id', filter=Q(priority__gte=5))
+            )
             
         except Exception as e:
             self.stdout.write(
@@ -236,7 +225,7 @@ class Command(BaseCommand):
             )
             return {}
 
-    def _display_results(self, scraped, processed_stats, summary, elapsed):
+    def _display_results(self, scraped, processed_stats, summary, elapsed, show_processed=False):
         """Display final results"""
         self.stdout.write('\n' + '=' * 60)
         self.stdout.write(self.style.SUCCESS('📈 SUMMARY REPORT'))
@@ -278,48 +267,63 @@ class Command(BaseCommand):
         if summary.get('critical', 0) > 0 or summary.get('high', 0) > 0:
             self.stdout.write(self.style.WARNING('\n🚨 ATTENTION REQUIRED:'))
             
-            # Get top 5 critical items
-            critical_items = NewsItem.objects.filter(
-                processed_by_llm=True,
-                risk_level='critical'
-            ).order_by('-risk_score', '-created_at')[:5]
+            # Top 5 critical and top 5 high-priority items in one query; the
+            # per-group ordering is folded into a ranked window
+            group_order = Case(When(risk_level='critical', then=Value(0)), default=F('priority'))
+            rows = NewsItem.objects.filter(
+                Q(risk_level='critical') | Q(risk_level='high', priority__gte=10),
+                processed_by_llm=True
+            ).annotate(
+                rank=Window(
+                    RowNumber(),
+                    partition_by=F('risk_level'),
+                    order_by=[group_order.desc(), F('risk_score').desc(), F('created_at').desc()]
+                )
+            ).filter(rank__lte=5).values('title', 'risk_level', 'risk_score', 'priority').order_by('rank')
+            
+            critical_items = []
+            high_items = []
+            for row in rows:
+                (critical_items if row['risk_level'] == 'critical' else high_items).append(row)
             
             if critical_items:
                 self.stdout.write(self.style.ERROR('\n   CRITICAL ITEMS:'))
                 for item in critical_items:
                     self.stdout.write(
-                        f'   • [{item.risk_score}/10] {item.title[:70]}...'
+                        f'   • [{item["risk_score"]}/10] {item["title"][:70]}...'
                     )
             
-            # Get top 10 high priority items
-            high_items = NewsItem.objects.filter(
-                processed_by_llm=True,
-                risk_level='high',
-                priority__gte=10
-            ).order_by('-priority', '-risk_score', '-created_at')[:5]
-            
             if high_items:
                 self.stdout.write(self.style.WARNING('\n   HIGH PRIORITY ITEMS:'))
                 for item in high_items:
                     self.stdout.write(
-                        f'   • [{item.priority}] {item.title[:70]}...'
+                        f'   • [{item["priority"]}] {item["title"][:70]}...'
                     )
                     
-             # Show all processed news with AI summary
+        # Show all processed news with AI summary (opt-in: this is the whole table)
+        if show_processed:
+            self._display_processed_news()
+
+    def _display_processed_news(self):
+        """Stream every processed article with its AI summary"""
         self.stdout.write(self.style.WARNING('\n🧠 PROCESSED NEWS WITH AI SUMMARY:'))
         
-        processed_items = NewsItem.objects.filter(processed_by_llm=True).order_by('-created_at')
+        processed_items = NewsItem.objects.filter(processed_by_llm=True).only(
+            'title', 'source', 'risk_level', 'priority', 'ai_summary'
+        ).order_by('-created_at').iterator(chunk_size=100)
 
-        if not processed_items.exists():
-            self.stdout.write('   No processed articles available.')
-        else:
-            for item in processed_items:
-                self.stdout.write('\n' + '-' * 60)
-                self.stdout.write(self.style.SUCCESS(f'📰 Title: {item.title}'))
-                self.stdout.write(f'🔗 Source: {item.source}')
-                self.stdout.write(f'⚠️  Risk Level: {item.risk_level.upper()}')
-                self.stdout.write(f'⭐ Priority: {item.priority}')
-                
-                summary_text = item.ai_summary or "(No AI summary generated)"
-                self.stdout.write(self.style.WARNING('\n📝 AI Summary:'))
-                self.stdout.write(f'{summary_text}')
\ No newline at end of file
+        shown = 0
+        for item in processed_items:
+            self.stdout.write('\n' + '-' * 60)
+            self.stdout.write(self.style.SUCCESS(f'📰 Title: {item.title}'))
+            self.stdout.write(f'🔗 Source: {item.source}')
+            self.stdout.write(f'⚠️  Risk Level: {item.risk_level.upper()}')
+            self.stdout.write(f'⭐ Priority: {item.priority}')
+            
+            summary_text = item.ai_summary or "(No AI summary generated)"
+            self.stdout.write(self.style.WARNING('\n📝 AI Summary:'))
+            self.stdout.write(f'{summary_text}')
+            shown += 1
+
+        if not shown:
+            self.stdout.write('   No processed articles available.')
\ No newline at end of file
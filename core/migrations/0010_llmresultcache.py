@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_newsitem_published_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMResultCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('model_name', models.CharField(max_length=100)),
+                ('ai_summary', models.TextField()),
+                ('risk_level', models.CharField(max_length=20)),
+                ('risk_score', models.IntegerField(default=5)),
+                ('risk_reason', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('content_hash', 'model_name'), name='uniq_llm_cache_hash_model')],
+            },
+        ),
+    ]
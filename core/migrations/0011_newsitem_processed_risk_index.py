@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_llmresultcache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['processed_by_llm', 'risk_level'], name='core_newsit_process_056957_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_newsitem_processed_risk_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsitem',
+            name='risk_level',
+            field=models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High'), ('critical', 'Critical')], db_index=True, default='low', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['created_at'], name='core_newsit_created_6ce77b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['priority', '-risk_score'], name='core_newsit_priorit_0d7024_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['risk_score'], name='core_newsit_risk_sc_3a69c3_idx'),
+        ),
+    ]
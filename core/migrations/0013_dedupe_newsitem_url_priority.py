@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:12
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def dedupe_urls(apps, schema_editor):
+    """Make existing rows satisfy the new unique constraint on url"""
+    NewsItem = apps.get_model('core', 'NewsItem')
+    NewsItem.objects.filter(url='').update(url=None)
+
+    duplicates = (
+        NewsItem.objects.exclude(url=None)
+        .values('url')
+        .annotate(n=Count('id'), keep=Min('id'))
+        .filter(n__gt=1)
+    )
+    for dup in duplicates:
+        NewsItem.objects.filter(url=dup['url']).exclude(id=dup['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_newsitem_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_urls, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='newsitem',
+            name='url',
+            field=models.URLField(blank=True, max_length=1000, null=True, unique=True),
+        ),
+    ]
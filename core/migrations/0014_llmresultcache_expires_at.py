@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_dedupe_newsitem_url_priority'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='llmresultcache',
+            name='expires_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:30
+
+import json
+
+from django.db import migrations, models
+
+
+def wrap_plain_text(apps, schema_editor):
+    """Store every risk_reason as JSON: keep JSON objects, wrap plain sentences"""
+    NewsItem = apps.get_model('core', 'NewsItem')
+    updated = []
+    for item in NewsItem.objects.exclude(risk_reason=None).only('id', 'risk_reason').iterator():
+        try:
+            value = json.loads(item.risk_reason)
+        except ValueError:
+            value = None
+        if not isinstance(value, dict):
+            value = {'risk_reasoning': item.risk_reason}
+        item.risk_reason = json.dumps(value)
+        updated.append(item)
+    NewsItem.objects.bulk_update(updated, ['risk_reason'], batch_size=500)
+
+
+def unwrap_plain_text(apps, schema_editor):
+    NewsItem = apps.get_model('core', 'NewsItem')
+    updated = []
+    for item in NewsItem.objects.exclude(risk_reason=None).only('id', 'risk_reason').iterator():
+        value = json.loads(item.risk_reason)
+        if list(value) == ['risk_reasoning']:
+            item.risk_reason = value['risk_reasoning']
+            updated.append(item)
+    NewsItem.objects.bulk_update(updated, ['risk_reason'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_llmresultcache_expires_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(wrap_plain_text, unwrap_plain_text),
+        migrations.AlterField(
+            model_name='newsitem',
+            name='risk_reason',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_newsitem_risk_reason_json'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['source', 'title'], name='core_newsit_source_1e6d50_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_newsitem_source_title_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HttpCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=1000, unique=True)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('last_modified', models.CharField(blank=True, max_length=64)),
+                ('content_type', models.CharField(blank=True, max_length=255)),
+                ('body', models.BinaryField()),
+                ('fetched_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_httpcache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(condition=models.Q(('processed_by_llm', True)), fields=['-risk_score', '-priority'], name='idx_processed_risk'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:52
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_newsitem_idx_processed_risk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsitem',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
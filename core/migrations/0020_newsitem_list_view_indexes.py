@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-15 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_newsitem_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='newsitem',
+            name='core_newsit_process_056957_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='newsitem',
+            name='core_newsit_priorit_0d7024_idx',
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(condition=models.Q(('processed_by_llm', True)), fields=['-priority', '-risk_score', '-created_at'], name='news_prio_composite'),
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(condition=models.Q(('processed_by_llm', True)), fields=['risk_level', '-risk_score', '-created_at'], name='news_risk'),
+        ),
+        migrations.AddIndex(
+            model_name='newsitem',
+            index=models.Index(fields=['priority', '-risk_score', '-created_at'], name='news_priority'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-15 04:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_create_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.UniqueConstraint(condition=models.Q(('state', 'STARTED')), fields=('queue',), name='one_started_job_per_queue'),
+        ),
+    ]
@@ -1,16 +1,18 @@
+import uuid
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Q
 
 
 class NewsItem(models.Model):
   
     source = models.CharField(max_length=255)
-    url = models.URLField(max_length=500, blank=True, null=True)
+    url = models.URLField(max_length=1000, unique=True, null=True, blank=True)
     title = models.CharField(max_length=500)
     summary = models.TextField()  # Short excerpt from scraping
     content = models.TextField(blank=True)  # Full article content
     ai_summary = models.TextField(null=True, blank=True)  # Your 500+ word summary
-    url = models.TextField(null=True, blank=True)
-    priority = models.IntegerField(default=1)
     # Add these fields for content tracking
     content_length = models.IntegerField(default=0)
     summary_length = models.IntegerField(default=0)
@@ -25,19 +27,146 @@ class NewsItem(models.Model):
             ('high', 'High'),
             ('critical', 'Critical'),
         ],
-        default='low'
+        default='low',
+        db_index=True
     )
     risk_score = models.IntegerField(default=5)  # 1 to 10
-    risk_reason = models.TextField(null=True, blank=True)
+    risk_reason = models.JSONField(null=True, blank=True)  # {'risk_reasoning': ..., ...}
 
     processed_by_llm = models.BooleanField(default=False)
     processed_at = models.DateTimeField(null=True, blank=True)
 
     priority = models.IntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
+    # bulk_update skips auto_now, so bulk writers set this themselves
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     published_date = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Each covers a list view's filter and full ORDER BY, so pages come
+            # straight off the index with no sort step. The boolean filter is a
+            # partial-index condition rather than a leading column because
+            # SQLite gets it as a bare `WHERE processed_by_llm`, which it can
+            # match to a condition but not to an indexed column.
+            models.Index(
+                fields=['-priority', '-risk_score', '-created_at'],
+                condition=Q(processed_by_llm=True),
+                name='news_prio_composite',
+            ),  # high_priority_news_list
+            models.Index(
+                fields=['risk_level', '-risk_score', '-created_at'],
+                condition=Q(processed_by_llm=True),
+                name='news_risk',
+            ),  # critical_news_list
+            models.Index(
+                fields=['priority', '-risk_score', '-created_at'],
+                name='news_priority',
+            ),  # news_by_priority
+            models.Index(fields=['created_at']),
+            models.Index(fields=['risk_score']),
+            models.Index(fields=['source', 'title']),  # scraper (title, source) dedupe
+            # processed_news_list's default ordering, without a sort step
+            models.Index(
+                fields=['-risk_score', '-priority'],
+                condition=Q(processed_by_llm=True),
+                name='idx_processed_risk',
+            ),
+        ]
+
     def __str__(self):
         return self.title[:100]
 
 
+
+class LLMResultCache(models.Model):
+    """AI verdicts keyed by a hash of title + article content, reused across reprints"""
+
+    content_hash = models.CharField(max_length=64)  # Indexed via the unique constraint
+    model_name = models.CharField(max_length=100)
+    ai_summary = models.TextField()
+    risk_level = models.CharField(max_length=20)
+    risk_score = models.IntegerField(default=5)
+    risk_reason = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_hash', 'model_name'], name='uniq_llm_cache_hash_model'),
+        ]
+
+    def __str__(self):
+        return f"{self.model_name}:{self.content_hash[:12]}"
+
+
+class HttpCache(models.Model):
+    """Validators and body of the last 200 response for a scraped listing page"""
+
+    url = models.URLField(max_length=1000, unique=True)
+    etag = models.CharField(max_length=255, blank=True)
+    last_modified = models.CharField(max_length=64, blank=True)
+    content_type = models.CharField(max_length=255, blank=True)  # keeps the charset for re-parsing
+    body = models.BinaryField()
+    fetched_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.url
+
+
+def new_job_id():
+    return uuid.uuid4().hex
+
+
+class Job(models.Model):
+    """
+    A background task queued by an API endpoint
+
+    Rows are the queue itself: whichever process runs a queue's dispatcher
+    claims the oldest PENDING job, so any web worker can report on any job.
+    """
+
+    STATES = [
+        ('PENDING', 'Pending'),
+        ('STARTED', 'Started'),
+        ('SUCCESS', 'Success'),
+        ('FAILURE', 'Failure'),
+    ]
+
+    id = models.CharField(primary_key=True, max_length=32, default=new_job_id, editable=False)
+    name = models.CharField(max_length=50)
+    queue = models.CharField(max_length=20)
+    task = models.CharField(max_length=100)  # key into core.tasks.TASKS
+    kwargs = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    state = models.CharField(max_length=10, choices=STATES, default='PENDING')
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Refreshed while STARTED; a stale one means the worker process died
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['queue', 'state', 'created_at']),  # dispatcher claim
+        ]
+        constraints = [
+            # One running job per queue, enforced by the database across processes
+            models.UniqueConstraint(
+                fields=['queue'], condition=Q(state='STARTED'), name='one_started_job_per_queue'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name}:{self.id}"
+
+
+class JobEvent(models.Model):
+    """One progress event reported by a running Job, in arrival order"""
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='events')
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+
+    def __str__(self):
+        return f"{self.job_id}#{self.id}"
@@ -0,0 +1,205 @@
+# core/near_duplicates.py
+
+import hashlib
+import logging
+import os
+import pickle
+import random
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import NewsItem
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+BANDS = 4  # 4 bands x 16 rows puts the LSH threshold at ~0.92 Jaccard
+THRESHOLD = 0.9
+SHINGLE_SIZE = 5
+
+# Tail of generate_fallback_analysis summaries, which must not be propagated
+FALLBACK_SUMMARY_SUFFIX = "AI analysis temporarily unavailable."
+REUSED_FIELDS = ('ai_summary', 'risk_level', 'risk_score', 'risk_reason')
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    """Word k-shingles of normalized text"""
+    words = text.lower().split()
+    if len(words) < k:
+        return set()
+    return {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def _stable_hash(shingle):
+    # hash() is salted per process, which would break the pickled index
+    return int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'little')
+
+
+class NearDuplicateIndex:
+    """
+    MinHash LSH over article text
+
+    Signatures are split into BANDS buckets; any shared bucket makes a
+    candidate, which is confirmed when the estimated Jaccard similarity
+    reaches THRESHOLD.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, threshold=THRESHOLD, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+
+    def signature(self, text):
+        """MinHash signature of `text`, or None when it is too short to shingle"""
+        hashes = [_stable_hash(s) for s in shingles(text)]
+        if not hashes:
+            return None
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.perms
+        )
+
+    def _bands(self, sig):
+        for i in range(self.bands):
+            yield i, sig[i * self.rows:(i + 1) * self.rows]
+
+    def add(self, key, sig):
+        if sig is None or key in self.signatures:
+            return
+        self.signatures[key] = sig
+        for i, band in self._bands(sig):
+            self.buckets[i].setdefault(band, []).append(key)
+
+    def remove(self, key):
+        sig = self.signatures.pop(key, None)
+        if sig is None:
+            return
+        for i, band in self._bands(sig):
+            keys = self.buckets[i].get(band)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del self.buckets[i][band]
+
+    def query(self, sig, exclude=None):
+        """Key of the most similar indexed item at or above the threshold, or None"""
+        if sig is None:
+            return None
+
+        candidates = set()
+        for i, band in self._bands(sig):
+            candidates.update(self.buckets[i].get(band, ()))
+        candidates.discard(exclude)
+
+        best_key, best_sim = None, self.threshold
+        for key in candidates:
+            other = self.signatures[key]
+            sim = sum(1 for x, y in zip(sig, other) if x == y) / self.num_perm
+            if sim >= best_sim:
+                best_key, best_sim = key, sim
+        return best_key
+
+
+def item_text(news_item):
+    """Text used for near-duplicate matching"""
+    # Processed items keep only 2000 chars of content, so compare like with like
+    return (news_item.content or f"{news_item.title} {news_item.summary}")[:2000]
+
+
+def _index_path():
+    return getattr(settings, 'NEAR_DUPLICATE_INDEX_PATH', settings.BASE_DIR / 'near_duplicates.pkl')
+
+
+def load_index():
+    """Load the pickled index (or start a new one) and sync it with the DB"""
+    index = None
+    path = _index_path()
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                index = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load near-duplicate index, rebuilding: {e}")
+    if index is None:
+        index = NearDuplicateIndex()
+    sync_index(index)
+    return index
+
+
+def sync_index(index):
+    """Index newly processed items and drop ones that were deleted or reset"""
+    # Only real verdicts are worth copying: skip error rows and keyword fallbacks
+    processed_ids = set(
+        NewsItem.objects.filter(processed_by_llm=True, processed_at__isnull=False)
+        .exclude(ai_summary__endswith=FALLBACK_SUMMARY_SUFFIX)
+        .values_list('id', flat=True)
+    )
+
+    for key in set(index.signatures) - processed_ids:
+        index.remove(key)
+
+    missing = list(processed_ids - set(index.signatures))
+    for start in range(0, len(missing), 500):
+        chunk = NewsItem.objects.filter(id__in=missing[start:start + 500]).only('id', 'title', 'summary', 'content')
+        for item in chunk:
+            index.add(item.id, index.signature(item_text(item)))
+    if missing:
+        logger.info(f"🧬 Indexed {len(missing)} processed items for near-duplicate matching")
+
+
+def save_index(index):
+    path = _index_path()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def reuse_near_duplicates(items, index):
+    """
+    Copy verdicts onto items that near-duplicate an already processed one
+
+    Returns the items that still need the LLM and the number reused.
+    """
+    matches = {}
+    pending = []
+    for item in items:
+        match = index.query(index.signature(item_text(item)), exclude=item.id)
+        if match is None:
+            pending.append(item)
+        else:
+            matches[item] = match
+
+    if not matches:
+        return pending, 0
+
+    sources = NewsItem.objects.only(*REUSED_FIELDS).in_bulk(set(matches.values()))
+    reused = []
+    now = timezone.now()
+    for item, match in matches.items():
+        source = sources.get(match)
+        if source is None:
+            pending.append(item)
+            continue
+        for field in REUSED_FIELDS:
+            setattr(item, field, getattr(source, field))
+        item.processed_by_llm = True
+        item.processed_at = now
+        item.updated_at = now
+        reused.append(item)
+        logger.info(f"🧬 Near-duplicate of {match}: {item.title[:50]}...")
+
+    NewsItem.objects.bulk_update(reused, list(REUSED_FIELDS) + ['processed_by_llm', 'processed_at', 'updated_at'])
+    return pending, len(reused)
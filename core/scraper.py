@@ -1,22 +1,30 @@
 # core/scraper.py - FIXED VERSION (Cybersecurity news only)
 
-import requests
+import asyncio
+import httpx
 import random
 import time
+import weakref
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 from datetime import datetime, timedelta
 import re
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.db import transaction
 from django.utils import timezone
  
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cyberagent.settings")
-import django
-django.setup()
-from core.models import NewsItem
+# Standalone runs need Django set up; inside the project it already is (or
+# is finishing: CoreConfig.ready imports this), and setup() isn't reentrant
+from django.apps import apps
+if not apps.apps_ready:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "cyberagent.settings")
+    import django
+    django.setup()
+from core.models import HttpCache, NewsItem
 
 HEADERS = {
     "User-Agent": (
@@ -26,12 +34,33 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# Keep-alive connection pool shared by one scraper run; transient
+# 429/502/503/504s are retried with backoff (honouring Retry-After) in _get
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_RETRIES = 3
+RETRY_BACKOFF = 1.0
+RETRY_STATUSES = {429, 502, 503, 504}
+# Separate connect budget so a dead host fails fast without cutting off slow pages
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+ROBOTS_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+MAX_PAGE_BYTES = 500_000  # bodies are cut here; outlier pages can run to several MB
+
 CRAWL_DELAY = 3
 MAX_ARTICLES_PER_SITE = 20
 HOURS_LOOKBACK = 24
+ARTICLE_FETCH_WORKERS = 16  # article pages in flight at once in save_to_db
+ARTICLE_FETCHES_PER_HOST = 4  # ...and at most this many against one site
+
+# robots.txt rules per origin: (RobotFileParser or None to allow all, fetched at, ttl seconds)
+ROBOTS_TTL = 3600
+ROBOTS_NEGATIVE_TTL = 60
+_ROBOTS_CACHE = {}
+_ROBOTS_INFLIGHT = {}  # (event loop, origin) -> task fetching it
+_HOST_LOCKS = weakref.WeakKeyDictionary()  # event loop -> {host: asyncio.Lock}
+_HOST_NEXT_REQUEST = {}  # host -> monotonic time its next listing request may start
 
 # ONLY cybersecurity-focused sites
-URLS = [
+URLS = (
     "https://krebsonsecurity.com",
     "https://thehackernews.com",
     "https://www.darkreading.com",
@@ -43,7 +72,7 @@ URLS = [
     "https://www.bankinfosecurity.com",
     "https://gbhackers.com",
     "https://www.schneier.com",
-]
+)
 
 # STRICT cybersecurity keywords - must contain at least one
 REQUIRED_CYBERSECURITY_KEYWORDS = [
@@ -84,39 +113,162 @@ HIGH_PRIORITY_KEYWORDS = [
     'security flaw', 'cyber attack', 'apt', 'threat actor'
 ]
 
+# Context words that keep an excluded (AI/general tech) article in scope
+SECURITY_CONTEXT_KEYWORDS = ['security', 'vulnerability', 'breach', 'attack', 'threat']
+
+
+def _keyword_regex(keywords):
+    """
+    Regex answering 'does the text contain any keyword?' in a single scan
+
+    Keywords are folded into a character trie, so each position in the text
+    tries one branch per next character instead of every keyword in turn.
+    Only use it for presence checks: a keyword that extends a shorter one
+    is dropped, since the shorter keyword already matches.
+    """
+    trie = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def pattern(node):
+        if '' in node:
+            return ''
+        alts = [re.escape(ch) + pattern(child) for ch, child in sorted(node.items())]
+        return alts[0] if len(alts) == 1 else '(?:' + '|'.join(alts) + ')'
+
+    return re.compile(pattern(trie))
+
+
+_REQUIRED_RE = _keyword_regex(REQUIRED_CYBERSECURITY_KEYWORDS)
+_EXCLUDE_RE = _keyword_regex(EXCLUDE_KEYWORDS)
+_SECURITY_CONTEXT_RE = _keyword_regex(SECURITY_CONTEXT_KEYWORDS)
+_HIGH_PRIORITY_RE = _keyword_regex(HIGH_PRIORITY_KEYWORDS)
+
+# Date patterns for extract_date_from_text, each with the one format its
+# match can parse (None: ISO date, built straight from the groups)
+_HOURS_RE = re.compile(r'(\d+)\s*(?:hour|hr)')
+_DATE_PATTERNS = [
+    (re.compile(r'(\w{3})\s+(\d{1,2}),?\s+(\d{4})'), '%b %d, %Y'),
+    (re.compile(r'(\d{1,2})\s+(\w{3})\s+(\d{4})'), '%d %b %Y'),
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})'), None),
+]
+
+# Page selectors, in priority order. Each group is matched with one walk of
+# the tree via the combined selector, then ranked by the per-selector list.
+ARTICLE_SELECTORS = [
+    'article',
+    '.post',
+    '.entry',
+    '.story',
+    '.news-item',
+    '.article-item',
+]
+
+HEADLINE_SELECTORS = [
+    'h1 a', 'h2 a', 'h3 a',
+    '.headline a', '.post-title a', '.entry-title a',
+    '.story-title a', '.article-title a',
+    'article h2 a', 'header h1 a', 'header h2 a',
+]
+
+LISTING_DATE_SELECTORS = [
+    'time', '.date', '.post-date', '.published',
+    '.entry-date', '.story-date', '.timestamp',
+    'span[class*="date"]', 'span[class*="time"]',
+]
+
+PAGE_DATE_SELECTORS = [
+    '.date', '.published', '.post-date',
+    '.entry-date', '.timestamp',
+    'span[class*="date"]',
+    'div[class*="date"]',
+]
+
+# Common article body selectors (covers most news sites)
+CONTENT_SELECTORS = [
+    'article',
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.story-content',
+    '.content',
+    '#content',
+    'main',
+]
+
+
+def _compile_selectors(selectors):
+    """(combined selector, per-selector matchers) for a priority list"""
+    return sv.compile(', '.join(selectors)), [sv.compile(sel) for sel in selectors]
+
+
+_ARTICLE_SEL = sv.compile(', '.join(ARTICLE_SELECTORS))
+_HEADLINE_SEL = sv.compile(', '.join(HEADLINE_SELECTORS))
+_LISTING_DATE_SEL = _compile_selectors(LISTING_DATE_SELECTORS)
+_PAGE_DATE_SEL = _compile_selectors(PAGE_DATE_SELECTORS)
+_CONTENT_SEL = _compile_selectors(CONTENT_SELECTORS)
+
+
+def _first_matches(root, compiled):
+    """
+    First element under `root` for each selector that matches, in priority order
+
+    Equivalent to calling select_one() per selector, but walks the tree once.
+    """
+    combined, selectors = compiled
+    matches = combined.select(root)
+    for sel in selectors:
+        for tag in matches:
+            if sel.match(tag):
+                yield tag
+                break
+
 def make_aware_if_needed(dt):
     """Convert naive datetime to timezone-aware"""
     if dt and timezone.is_naive(dt):
         return timezone.make_aware(dt, timezone.get_current_timezone())
     return dt
 
-def is_cybersecurity_news(title: str, summary: str = "") -> bool:
-    """
-    Strictly check if article is cybersecurity-related
-    Must contain at least one required keyword
-    """
-    text = (title + " " + summary).lower()
-    
+def _is_cyber_text(text):
+    """Relevance check on already lowercased title + summary text"""
     # Must contain at least one cybersecurity keyword
-    has_cyber_keyword = any(keyword in text for keyword in REQUIRED_CYBERSECURITY_KEYWORDS)
-    
-    if not has_cyber_keyword:
+    if not _REQUIRED_RE.search(text):
         return False
     
     # Check if it's about AI/general tech WITHOUT security context
-    for exclude_kw in EXCLUDE_KEYWORDS:
-        if exclude_kw in text:
-            # Allow if it mentions security/vulnerability alongside AI
-            if not any(sec_kw in text for sec_kw in ['security', 'vulnerability', 'breach', 'attack', 'threat']):
-                return False
+    # Allow if it mentions security/vulnerability alongside AI
+    if _EXCLUDE_RE.search(text) and not _SECURITY_CONTEXT_RE.search(text):
+        return False
     
     return True
 
 
+def classify_article(title, summary=""):
+    """
+    Relevance and priority of an article in one pass
+    Returns (is_cybersecurity, is_high_priority)
+    """
+    text = (title + " " + summary).lower()
+    if not _is_cyber_text(text):
+        return False, False
+    return True, _HIGH_PRIORITY_RE.search(text) is not None
+
+
+def is_cybersecurity_news(title: str, summary: str = "") -> bool:
+    """
+    Strictly check if article is cybersecurity-related
+    Must contain at least one required keyword
+    """
+    return _is_cyber_text((title + " " + summary).lower())
+
+
 def is_high_priority(title, summary=""):
     """Check if article is high priority based on keywords"""
     text = (title + " " + summary).lower()
-    return any(keyword in text for keyword in HIGH_PRIORITY_KEYWORDS)
+    return _HIGH_PRIORITY_RE.search(text) is not None
 
 
 def extract_date_from_text(text):
@@ -129,7 +281,7 @@ def extract_date_from_text(text):
     
     # Check for relative dates
     if 'hour' in text or 'hr' in text:
-        hours_match = re.search(r'(\d+)\s*(?:hour|hr)', text)
+        hours_match = _HOURS_RE.search(text)
         if hours_match:
             hours = int(hours_match.group(1))
             return now - timedelta(hours=hours)
@@ -144,23 +296,14 @@ def extract_date_from_text(text):
         return now - timedelta(days=1)
     
     # Try to parse actual dates
-    date_patterns = [
-        r'(\w{3})\s+(\d{1,2}),?\s+(\d{4})',
-        r'(\d{1,2})\s+(\w{3})\s+(\d{4})',
-        r'(\d{4})-(\d{2})-(\d{2})',
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, text)
+    for pattern, fmt in _DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
-                date_str = match.group(0)
-                for fmt in ['%b %d, %Y', '%d %b %Y', '%Y-%m-%d', '%B %d, %Y']:
-                    try:
-                        return datetime.strptime(date_str, fmt)
-                    except:
-                        continue
-            except:
+                if fmt is None:
+                    return datetime(*map(int, match.groups()))
+                return datetime.strptime(match.group(0), fmt)
+            except ValueError:
                 continue
     
     return None
@@ -175,138 +318,262 @@ def is_within_timeframe(article_date, hours=HOURS_LOOKBACK):
     return article_date >= cutoff
 
 
-def is_allowed_by_robots(url):
-    """Check robots.txt before scraping"""
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+def make_client():
+    """Async HTTP client for one scraper run (bound to the running event loop)"""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        # retries here only cover connection failures; statuses are handled in _get
+        transport=httpx.AsyncHTTPTransport(retries=HTTP_RETRIES, limits=HTTP_LIMITS),
+    )
+
+
+def _retry_delay(resp, attempt):
+    retry_after = resp.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(int(retry_after), 30)
+    return RETRY_BACKOFF * (2 ** attempt)
+
+
+async def _read_capped(resp):
+    """Response with its body streamed in and cut at MAX_PAGE_BYTES"""
+    chunks = []
+    total = 0
+    async for chunk in resp.aiter_bytes():
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= MAX_PAGE_BYTES:
+            break
+    # The body is already decoded, so the transfer headers no longer apply
+    headers = [
+        (key, value) for key, value in resp.headers.multi_items()
+        if key.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+    ]
+    return httpx.Response(
+        resp.status_code,
+        headers=headers,
+        content=b"".join(chunks)[:MAX_PAGE_BYTES],
+        request=resp.request,
+    )
+
+
+async def _get(client, url, timeout=httpx.USE_CLIENT_DEFAULT, headers=None):
+    """GET that retries transient statuses before returning the response"""
+    for attempt in range(HTTP_RETRIES + 1):
+        async with client.stream("GET", url, timeout=timeout, headers=headers) as resp:
+            if resp.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                return await _read_capped(resp)
+            delay = _retry_delay(resp, attempt)
+        await asyncio.sleep(delay)
+
+
+async def _get_listing(client, url, http_cache):
+    """
+    GET a listing page, revalidating against http_cache (url -> HttpCache)
+
+    A 304 is answered from the cached body. A 200 carrying validators
+    replaces the entry with a new unsaved HttpCache for run_scraper to store.
+    """
+    entry = http_cache.get(url)
+    headers = {}
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
     
+    resp = await _get(client, url, headers=headers)
+    if resp.status_code == 304 and entry is not None:
+        return httpx.Response(
+            200,
+            content=bytes(entry.body),
+            headers={"Content-Type": entry.content_type},
+            request=resp.request,
+        )
+    
+    etag = resp.headers.get("ETag", "")
+    last_modified = resp.headers.get("Last-Modified", "")
+    if resp.status_code == 200 and (etag or last_modified):
+        http_cache[url] = HttpCache(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=resp.headers.get("Content-Type", ""),
+            body=resp.content,
+        )
+    return resp
+
+
+def _make_soup(resp):
+    """Parse a response body from raw bytes"""
+    # lxml decodes in C; a header charset skips sniffing, otherwise the
+    # page's <meta charset> is honoured instead of httpx's utf-8 default
+    return BeautifulSoup(resp.content, "lxml", from_encoding=resp.charset_encoding)
+
+
+async def _fetch_robots_rules(client, origin):
+    """
+    Fetch and parse an origin's robots.txt and how long to trust it
+    
+    Returns None (allow everything) when there is no usable robots.txt:
+    a missing file keeps that for the full TTL; rate limits, server errors
+    and network failures are retried soon.
+    """
     try:
-        resp = requests.get(robots_url, headers=HEADERS, timeout=5)
-        if resp.status_code != 200:
-            return True
-        
-        disallowed = []
-        for line in resp.text.splitlines():
-            if line.startswith("Disallow:"):
-                path = line.replace("Disallow:", "").strip()
-                if path:
-                    disallowed.append(path)
-        
-        path = parsed.path
-        for rule in disallowed:
-            if path.startswith(rule):
-                return False
-        return True
-    except:
-        return True
+        resp = await _get(client, f"{origin}/robots.txt", timeout=ROBOTS_TIMEOUT)
+    except Exception:
+        return None, ROBOTS_NEGATIVE_TTL
+    
+    if resp.status_code == 429 or resp.status_code >= 500:
+        return None, ROBOTS_NEGATIVE_TTL
+    if resp.status_code != 200:
+        return None, ROBOTS_TTL
+    
+    parser = RobotFileParser()
+    parser.parse(resp.text.splitlines())
+    return parser, ROBOTS_TTL
+
+
+async def _refresh_robots(client, origin):
+    parser, ttl = await _fetch_robots_rules(client, origin)
+    entry = (parser, time.monotonic(), ttl)
+    _ROBOTS_CACHE[origin] = entry
+    return entry
+
+
+async def is_allowed_by_robots(client, url, parsed=None):
+    """Check robots.txt before scraping (rules cached per origin)"""
+    if parsed is None:
+        parsed = urlparse(url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    
+    entry = _ROBOTS_CACHE.get(origin)
+    if entry is None or time.monotonic() - entry[1] >= entry[2]:
+        # Single-flight: the first caller fetches, concurrent callers await its task
+        key = (asyncio.get_running_loop(), origin)
+        task = _ROBOTS_INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_refresh_robots(client, origin))
+            _ROBOTS_INFLIGHT[key] = task
+            task.add_done_callback(lambda _: _ROBOTS_INFLIGHT.pop(key, None))
+        entry = await task
+    
+    parser = entry[0]
+    return parser is None or parser.can_fetch(HEADERS["User-Agent"], url)
+
+
+def _host_lock(host):
+    """Per-host lock for the running event loop"""
+    locks = _HOST_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(host, asyncio.Lock())
+
+
+def _crawl_delay(origin):
+    """robots.txt Crawl-delay for an origin, else CRAWL_DELAY"""
+    entry = _ROBOTS_CACHE.get(origin)
+    delay = entry[0].crawl_delay(HEADERS["User-Agent"]) if entry and entry[0] else None
+    return CRAWL_DELAY if delay is None else float(delay)
 
 
-def scrape_site(url):
+def _resolve_link(link, origin, page_url):
+    """Make a root-relative href absolute; other links are left as found"""
+    if not link or not link.startswith('/'):
+        return link
+    if link.startswith('//'):  # protocol-relative
+        return urljoin(page_url, link)
+    return origin + link
+
+
+async def scrape_site(client, url, http_cache=None):
     """Scrape a single site for recent cybersecurity news"""
-    if not is_allowed_by_robots(url):
+    if http_cache is None:
+        http_cache = {}
+    
+    # Parsed once; robots, politeness and link resolution all reuse it
+    parsed = urlparse(url)
+    host = parsed.netloc
+    origin = f"{parsed.scheme}://{host}"
+    
+    if not await is_allowed_by_robots(client, url, parsed):
         print(f"❌ Not allowed by robots.txt: {url}")
         return []
     
-    time.sleep(CRAWL_DELAY + random.uniform(0.5, 1.5))
-    
     try:
-        for attempt in range(3):
-            resp = requests.get(url, headers=HEADERS, timeout=10)
-            if resp.status_code in [403, 429]:
-                time.sleep(2 + attempt)
-                continue
-            break
+        # Politeness is per host: one listing request at a time, spaced by
+        # the crawl delay, while other hosts carry on. A host that has not
+        # been hit recently is fetched straight away.
+        async with _host_lock(host):
+            wait = _HOST_NEXT_REQUEST.get(host, 0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                resp = await _get_listing(client, url, http_cache)
+            finally:
+                _HOST_NEXT_REQUEST[host] = time.monotonic() + _crawl_delay(origin) + random.uniform(0.5, 1.5)
         
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        
-        # Enhanced selectors
-        article_selectors = [
-            'article',
-            '.post',
-            '.entry',
-            '.story',
-            '.news-item',
-            '.article-item',
-        ]
-        
-        headline_selectors = [
-            'h1 a', 'h2 a', 'h3 a',
-            '.headline a', '.post-title a', '.entry-title a',
-            '.story-title a', '.article-title a',
-            'article h2 a', 'header h1 a', 'header h2 a',
-        ]
-        
-        date_selectors = [
-            'time', '.date', '.post-date', '.published',
-            '.entry-date', '.story-date', '.timestamp',
-            'span[class*="date"]', 'span[class*="time"]',
-        ]
+        soup = _make_soup(resp)
         
         articles = []
+        seen_links = set()  # the same story is often linked from several blocks
         
         # Try to find complete article blocks
-        for selector in article_selectors:
-            for article in soup.select(selector):
-                title_tag = article.select_one('h1 a, h2 a, h3 a, a[class*="title"]')
-                if not title_tag:
-                    continue
-                
-                title = title_tag.get_text(strip=True)
-                link = title_tag.get('href')
-                
-                if link and link.startswith('/'):
-                    link = urljoin(url, link)
-                
-                # Look for date
-                date_tag = None
-                for date_sel in date_selectors:
-                    date_tag = article.select_one(date_sel)
-                    if date_tag:
-                        break
-                
-                date_text = date_tag.get_text(strip=True) if date_tag else None
-                datetime_attr = date_tag.get('datetime') if date_tag else None
-                
-                article_date = extract_date_from_text(datetime_attr or date_text or '')
+        for article in _ARTICLE_SEL.select(soup):
+            title_tag = article.select_one('h1 a, h2 a, h3 a, a[class*="title"]')
+            if not title_tag:
+                continue
+            
+            title = title_tag.get_text(strip=True)
+            link = title_tag.get('href')
+            
+            link = _resolve_link(link, origin, url)
+            
+            # Look for date
+            date_tag = next(_first_matches(article, _LISTING_DATE_SEL), None)
+            
+            date_text = date_tag.get_text(strip=True) if date_tag else None
+            datetime_attr = date_tag.get('datetime') if date_tag else None
+            
+            article_date = extract_date_from_text(datetime_attr or date_text or '')
+            
+            # Look for summary
+            summary_tag = article.select_one('.excerpt, .summary, .description, p')
+            summary = summary_tag.get_text(strip=True) if summary_tag else title
+            
+            if title and link and link not in seen_links:
+                seen_links.add(link)
+                articles.append({
+                    'title': title,
+                    'url': link,
+                    'date': article_date,
+                    'summary': summary,
+                })
+        
+        # Fallback: simple headline extraction
+        if not articles:
+            for tag in _HEADLINE_SEL.select(soup):
+                title = tag.get_text(strip=True)
+                link = tag.get('href')
                 
-                # Look for summary
-                summary_tag = article.select_one('.excerpt, .summary, .description, p')
-                summary = summary_tag.get_text(strip=True) if summary_tag else title
+                link = _resolve_link(link, origin, url)
                 
-                if title and link:
+                if title and link and link not in seen_links:
+                    seen_links.add(link)
                     articles.append({
                         'title': title,
                         'url': link,
-                        'date': article_date,
-                        'summary': summary,
+                        'date': None,
+                        'summary': title,
                     })
         
-        # Fallback: simple headline extraction
-        if not articles:
-            for selector in headline_selectors:
-                for tag in soup.select(selector):
-                    title = tag.get_text(strip=True)
-                    link = tag.get('href')
-                    
-                    if link and link.startswith('/'):
-                        link = urljoin(url, link)
-                    
-                    if title and link:
-                        articles.append({
-                            'title': title,
-                            'url': link,
-                            'date': None,
-                            'summary': title,
-                        })
-        
         # STRICT FILTERING: Only cybersecurity news
         cyber_articles = []
         for art in articles:
-            if is_cybersecurity_news(art['title'], art.get('summary', '')):
-                if is_within_timeframe(art.get('date')):
-                    art['is_priority'] = is_high_priority(art['title'], art.get('summary', ''))
-                    cyber_articles.append(art)
+            is_cyber, is_priority = classify_article(art['title'], art.get('summary', ''))
+            if is_cyber and is_within_timeframe(art.get('date')):
+                art['is_priority'] = is_priority
+                cyber_articles.append(art)
         
         # Sort by priority and date
         cyber_articles.sort(
@@ -324,107 +591,120 @@ def scrape_site(url):
     except Exception as e:
         print(f"❌ Error scraping {url}: {e}")
         return []
-def fetch_full_article_content(article_url):
-    """Fetch and extract full article content from article page"""
-    try:
-        resp = requests.get(article_url, headers=HEADERS, timeout=10)
-        resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # Remove unwanted tags
-        for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'form']):
-            tag.decompose()
-
-        # Common article body selectors (covers most news sites)
-        content_selectors = [
-            'article',
-            '.article-content',
-            '.post-content',
-            '.entry-content',
-            '.story-content',
-            '.content',
-            '#content',
-            'main',
-        ]
-
-        article_body = None
-        for selector in content_selectors:
-            article_body = soup.select_one(selector)
-            if article_body:
-                break
 
-        if not article_body:
-            return ""
+def _extract_publish_date(soup):
+    """Publish date from an article page, or None"""
+    # 1. <time datetime="...">
+    time_tag = soup.find("time")
+    if time_tag:
+        datetime_val = time_tag.get("datetime") or time_tag.get_text(strip=True)
+        date = extract_date_from_text(datetime_val)
+        if date:
+            return date
+
+    # 2. Meta tags (most reliable)
+    meta_props = [
+        {"property": "article:published_time"},
+        {"name": "pubdate"},
+        {"name": "publish-date"},
+        {"name": "date"},
+    ]
 
-        paragraphs = []
-        for p in article_body.find_all('p'):
-            text = p.get_text(strip=True)
-            if len(text) > 50:  # ignore junk lines
-                paragraphs.append(text)
+    for prop in meta_props:
+        meta = soup.find("meta", prop)
+        if meta and meta.get("content"):
+            date = extract_date_from_text(meta["content"])
+            if date:
+                return date
 
-        return "\n\n".join(paragraphs)
+    # 3. Visible date text fallback
+    for tag in _first_matches(soup, _PAGE_DATE_SEL):
+        date = extract_date_from_text(tag.get_text(strip=True))
+        if date:
+            return make_aware_if_needed(date)
 
-    except Exception as e:
-        print(f"⚠️ Failed to fetch full content: {article_url} | {e}")
+    return None
+
+
+def _extract_content(soup):
+    """Article body paragraphs joined by blank lines ("" when none found)"""
+    # Remove unwanted tags
+    for tag in soup(['script', 'style', 'nav', 'footer', 'aside', 'form']):
+        tag.decompose()
+
+    article_body = next(_first_matches(soup, _CONTENT_SEL), None)
+
+    if not article_body:
         return ""
 
-def fetch_article_publish_date(article_url):
-    """Extract publish date from article page"""
+    paragraphs = []
+    for p in article_body.find_all('p'):
+        text = p.get_text(strip=True)
+        if len(text) > 50:  # ignore junk lines
+            paragraphs.append(text)
+
+    return "\n\n".join(paragraphs)
+
+
+async def fetch_article(client, article_url):
+    """Fetch an article page once and return (full content, publish date)"""
     try:
-        resp = requests.get(article_url, headers=HEADERS, timeout=10)
+        resp = await _get(client, article_url)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = _make_soup(resp)
+    except Exception as e:
+        print(f"⚠️ Failed to fetch article: {article_url} | {e}")
+        return "", None
 
-        # 1. <time datetime="...">
-        time_tag = soup.find("time")
-        if time_tag:
-            datetime_val = time_tag.get("datetime") or time_tag.get_text(strip=True)
-            date = extract_date_from_text(datetime_val)
-            if date:
-                return date
+    # Date first: content extraction decomposes tags that may hold it
+    try:
+        publish_date = _extract_publish_date(soup)
+    except Exception as e:
+        print(f"⚠️ Publish date extraction failed: {article_url} | {e}")
+        publish_date = None
+
+    try:
+        content = _extract_content(soup)
+    except Exception as e:
+        print(f"⚠️ Content extraction failed: {article_url} | {e}")
+        content = ""
 
-        # 2. Meta tags (most reliable)
-        meta_props = [
-            {"property": "article:published_time"},
-            {"name": "pubdate"},
-            {"name": "publish-date"},
-            {"name": "date"},
-        ]
-
-        for prop in meta_props:
-            meta = soup.find("meta", prop)
-            if meta and meta.get("content"):
-                date = extract_date_from_text(meta["content"])
-                if date:
-                    return date
-
-        # 3. Visible date text fallback
-        date_selectors = [
-            '.date', '.published', '.post-date',
-            '.entry-date', '.timestamp',
-            'span[class*="date"]',
-            'div[class*="date"]',
-        ]
-
-        for selector in date_selectors:
-            tag = soup.select_one(selector)
-            if tag:
-                date = extract_date_from_text(tag.get_text(strip=True))
-                if date:
-                    return make_aware_if_needed(date)
+    return content, publish_date
 
 
-    except Exception as e:
-        print(f"⚠️ Publish date fetch failed: {article_url} | {e}")
+async def _fetch_articles(urls):
+    """fetch_article for every URL, within the global and per-host limits"""
+    sem = asyncio.Semaphore(ARTICLE_FETCH_WORKERS)
+    host_sems = {}
+    
+    async def fetch(client, url):
+        host = urlparse(url).netloc
+        host_sem = host_sems.setdefault(host, asyncio.Semaphore(ARTICLE_FETCHES_PER_HOST))
+        async with host_sem, sem:
+            return await fetch_article(client, url)
+    
+    async with make_client() as client:
+        return await asyncio.gather(*(fetch(client, url) for url in urls))
 
-    return None
 
 def save_to_db(news_map):
     created_items = []
     duplicate_count = 0
     non_cyber_count = 0
     
+    # One lookup each for stored URLs and (title, source) pairs; entries added
+    # below join the sets so a story listed twice in this run is saved once
+    all_urls = [item['url'] for items in news_map.values() for item in items]
+    seen_urls = set(NewsItem.objects.filter(url__in=all_urls).values_list('url', flat=True))
+    all_titles = [item['title'] for items in news_map.values() for item in items]
+    seen_titles = set(
+        NewsItem.objects.filter(title__in=all_titles, source__in=list(news_map))
+        .values_list('title', 'source')
+    )
+    
+    # Filter first so only new, relevant articles cost an HTTP fetch
+    pending = []
     for site, items in news_map.items():
         for item in items:
             # Double-check cybersecurity relevance
@@ -433,41 +713,40 @@ def save_to_db(news_map):
                 continue
             
             # Check for duplicates
-            existing = NewsItem.objects.filter(
-                url=item['url']
-            ).first() or NewsItem.objects.filter(
-                title=item['title'],
-                source=site
-            ).first()
-            
-            if existing:
+            if item['url'] in seen_urls or (item['title'], site) in seen_titles:
                 duplicate_count += 1
                 continue
             
-            # Set priority
-            priority = 5 if item.get('is_priority') else 1
+            pending.append((site, item))
+            seen_urls.add(item['url'])
+            seen_titles.add((item['title'], site))
 
-            # 🔥 NEW: fetch full article data
-            full_content = fetch_full_article_content(item['url'])
-            publish_date = fetch_article_publish_date(item['url'])
+    # 🔥 Fetch article pages concurrently; DB writes stay on this thread
+    bundles = asyncio.run(_fetch_articles([item['url'] for _, item in pending])) if pending else []
 
-            if not publish_date:
-                publish_date = item.get('date')
+    for (site, item), (full_content, publish_date) in zip(pending, bundles):
+        # Set priority
+        priority = 5 if item.get('is_priority') else 1
 
-            # 🔥 FIX: make timezone-aware
-            publish_date = make_aware_if_needed(publish_date)
+        if not publish_date:
+            publish_date = item.get('date')
 
-            obj = NewsItem.objects.create(
-                title=item['title'],
-                summary=item.get('summary', item['title']),
-                content=full_content[:80000],  # safety limit
-                source=site,
-                url=item['url'],
-                priority=priority,
-                published_date=publish_date,
-            )
+        # 🔥 FIX: make timezone-aware
+        publish_date = make_aware_if_needed(publish_date)
 
-            created_items.append(obj)
+        created_items.append(NewsItem(
+            title=item['title'],
+            summary=item.get('summary', item['title']),
+            content=full_content[:80000],  # safety limit
+            source=site,
+            url=item['url'],
+            priority=priority,
+            published_date=publish_date,
+        ))
+
+    # The unique url index turns any concurrent insert of the same article into a no-op
+    with transaction.atomic():
+        NewsItem.objects.bulk_create(created_items, batch_size=500, ignore_conflicts=True)
 
     print(f"\n📊 Summary: {len(created_items)} new articles saved")
     print(f"   Duplicates skipped: {duplicate_count}")
@@ -476,37 +755,56 @@ def save_to_db(news_map):
 
 
 
+async def _scrape_all(http_cache):
+    """Scrape every site concurrently, returning (site, articles) pairs"""
+    async def scrape(client, url):
+        try:
+            return url, await scrape_site(client, url, http_cache)
+        except Exception as e:
+            print(f"❌ Error scraping {url}: {e}")
+            return url, []
+    
+    async with make_client() as client:
+        return await asyncio.gather(*(scrape(client, url) for url in URLS))
+
+
 def run_scraper():
-    """Run scraper across all configured sites"""
+    """
+    Run scraper across all configured sites
+    
+    Returns (results, total_articles) where results maps site → articles.
+    """
     print(f"\n🔍 Starting cybersecurity news scraper (last {HOURS_LOOKBACK} hours)...\n")
     
     results = {}
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        future_map = {executor.submit(scrape_site, url): url for url in URLS}
-        
-        for future in as_completed(future_map):
-            site = future_map[future]
-            try:
-                results[site] = future.result()
-            except Exception as e:
-                print(f"❌ Error scraping {site}: {e}")
-                results[site] = []
-    
-    # Calculate totals
-    total_articles = sum(len(v) for v in results.values())
-    high_priority_count = sum(
-        sum(1 for item in articles if item.get('is_priority'))
-        for articles in results.values()
-    )
+    total_articles = 0
+    high_priority_count = 0
+    # Listing pages are revalidated with ETag/Last-Modified; the ORM stays
+    # outside the event loop, so entries are loaded before and stored after
+    http_cache = HttpCache.objects.in_bulk(URLS, field_name='url')
+    # Crawl delays are per site, so all sites are fetched at once
+    for site, articles in asyncio.run(_scrape_all(http_cache)):
+        results[site] = articles
+        total_articles += len(articles)
+        high_priority_count += sum(1 for item in articles if item.get('is_priority'))
+    
+    refreshed = [entry for entry in http_cache.values() if entry.pk is None]
+    if refreshed:
+        HttpCache.objects.bulk_create(
+            refreshed,
+            update_conflicts=True,
+            unique_fields=['url'],
+            update_fields=['etag', 'last_modified', 'content_type', 'body', 'fetched_at'],
+        )
     
     print(f"\n✅ Scraping complete!")
     print(f"   Total cybersecurity articles: {total_articles}")
     print(f"   High-priority: {high_priority_count}")
     
-    return results
+    return results, total_articles
 
 
 if __name__ == "__main__":
-    scraped_data = run_scraper()
+    scraped_data, _ = run_scraper()
     saved_items = save_to_db(scraped_data)
     print(f"\n✅ Saved {len(saved_items)} new cybersecurity articles to database")
\ No newline at end of file
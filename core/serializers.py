@@ -3,6 +3,36 @@
 from rest_framework import serializers
 from .models import NewsItem
 
+class NewsItemListSerializer(serializers.ModelSerializer):
+    """Row shape for list endpoints: no article body or long-form AI summary"""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Callers that loaded only some columns pass them here so the
+        # serializer never touches a deferred field
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    class Meta:
+        model = NewsItem
+        fields = [
+            "id",
+            "title",
+            "source",
+            "url",
+            "summary",
+            "published_date",
+            "risk_level",
+            "risk_score",
+            "risk_reason",
+            "priority",
+            "processed_by_llm",
+            "created_at",
+        ]
+        read_only_fields = fields
+
+
 class NewsItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = NewsItem
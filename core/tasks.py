@@ -0,0 +1,287 @@
+# core/tasks.py
+
+import logging
+import queue as queue_module
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from .models import Job, JobEvent
+from .scraper import run_scraper, save_to_db
+from .ai_processor import process_unprocessed_news, process_high_priority_first
+from .agentic_processor import run_agentic_news_analysis
+
+logger = logging.getLogger(__name__)
+
+# Each queue runs one job at a time across every process sharing the DB:
+# slow LLM batches never hold up scraping, and two batches never pick up
+# the same unprocessed rows
+QUEUES = ('scrape', 'llm')
+MAX_TRACKED_JOBS = 200
+
+POLL_INTERVAL = 2  # seconds between checks for PENDING jobs
+TICK = 1  # how often a running job's progress events are flushed
+HEARTBEAT_INTERVAL = 30
+STALE_AFTER = timedelta(minutes=5)
+
+FINISHED_STATES = ('SUCCESS', 'FAILURE')
+
+_dispatchers = {}
+_dispatchers_lock = threading.Lock()
+_wakeup = {name: threading.Event() for name in QUEUES}
+_current = threading.local()
+
+
+def _claim(queue):
+    """Mark the queue's oldest PENDING job STARTED and return it, or None"""
+    # Cheap read first so idle polling never writes
+    if not Job.objects.filter(queue=queue, state='PENDING').exists():
+        return None
+    
+    now = timezone.now()
+    Job.objects.filter(
+        queue=queue, state='STARTED', heartbeat_at__lt=now - STALE_AFTER
+    ).update(state='FAILURE', finished_at=now, error='Worker stopped before the job finished')
+    if Job.objects.filter(queue=queue, state='STARTED').exists():
+        return None
+    job = Job.objects.filter(queue=queue, state='PENDING').order_by('created_at').first()
+    if job is None:
+        return None
+    
+    # The database settles races on any backend: the state='PENDING' filter
+    # lets only one process flip this row, and one_started_job_per_queue
+    # rejects a second STARTED job that another process claimed meanwhile
+    try:
+        with transaction.atomic():
+            claimed = Job.objects.filter(pk=job.pk, state='PENDING').update(
+                state='STARTED', started_at=now, heartbeat_at=now
+            )
+    except IntegrityError:
+        return None
+    return job if claimed == 1 else None
+
+
+def _run_job(job, events):
+    """Run the job's task on this thread and return the fields for its final state"""
+    _current.events = events
+    try:
+        result = TASKS[job.task](**job.kwargs)
+        return {'state': 'SUCCESS', 'result': result}
+    except Exception as e:
+        logger.exception(f"❌ Job {job.pk} failed")
+        return {'state': 'FAILURE', 'error': str(e)}
+    finally:
+        _current.events = None
+        # Worker threads outlive requests, so release their DB connection here
+        close_old_connections()
+        from .views import invalidate_news_caches
+        invalidate_news_caches()
+
+
+def _finish(job, fields):
+    try:
+        Job.objects.filter(pk=job.pk).update(finished_at=timezone.now(), **fields)
+    except TypeError as e:  # a result the JSON encoder refuses
+        Job.objects.filter(pk=job.pk).update(
+            state='FAILURE', finished_at=timezone.now(), error=f"Unserializable result: {e}"
+        )
+
+
+def _flush_events(job, events):
+    batch = []
+    while True:
+        try:
+            batch.append(events.get_nowait())
+        except queue_module.Empty:
+            break
+    if batch:
+        JobEvent.objects.bulk_create([JobEvent(job_id=job.pk, payload=event) for event in batch])
+
+
+def _dispatch(queue):
+    """Claim and run this queue's jobs forever; one dispatcher thread per queue per process"""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{queue}-job')
+    while True:
+        try:
+            job = _claim(queue)
+        except Exception:
+            logger.exception(f"❌ Could not claim a '{queue}' job")
+            job = None
+        if job is None:
+            _wakeup[queue].wait(POLL_INTERVAL)
+            _wakeup[queue].clear()
+            continue
+        
+        # Events are handed over in memory and written from here, since the
+        # job may report them from inside an event loop where the ORM is off limits
+        events = queue_module.SimpleQueue()
+        future = executor.submit(_run_job, job, events)
+        last_beat = time.monotonic()
+        while True:
+            done, _ = wait([future], timeout=TICK)
+            try:
+                _flush_events(job, events)
+                if done:
+                    # After the last flush, so streams never see the final state early
+                    _finish(job, future.result())
+                elif time.monotonic() - last_beat >= HEARTBEAT_INTERVAL:
+                    Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now())
+                    last_beat = time.monotonic()
+            except Exception:
+                logger.exception(f"❌ Could not record progress for job {job.pk}")
+            if done:
+                break
+
+
+def start_dispatchers():
+    """Start this process's queue dispatchers if they aren't running yet (see CoreConfig.ready)"""
+    with _dispatchers_lock:
+        for name in QUEUES:
+            thread = _dispatchers.get(name)
+            if thread is None or not thread.is_alive():
+                thread = threading.Thread(target=_dispatch, args=(name,), name=f'{name}-dispatcher', daemon=True)
+                thread.start()
+                _dispatchers[name] = thread
+
+
+def report_progress(event):
+    """Record a progress event for the job running on this thread, if any"""
+    events = getattr(_current, 'events', None)
+    if events is not None:
+        events.put(event)
+
+
+def enqueue(queue, name, func, **kwargs):
+    """Queue `func(**kwargs)` on the named queue and return its job id"""
+    if TASKS.get(func.__name__) is not func:
+        raise ValueError(f"{func.__name__} is not a registered task")
+    job = Job.objects.create(name=name, queue=queue, task=func.__name__, kwargs=kwargs)
+    
+    stale = Job.objects.filter(state__in=FINISHED_STATES).order_by('-created_at')[MAX_TRACKED_JOBS:]
+    Job.objects.filter(pk__in=list(stale.values_list('pk', flat=True))).delete()
+    
+    _wakeup[queue].set()
+    logger.info(f"📥 Queued {name} job {job.pk} on '{queue}'")
+    return job.pk
+
+
+def job_status(job_id):
+    """Snapshot of a job's state, or None for unknown/expired ids"""
+    job = Job.objects.filter(pk=job_id).first()
+    if job is None:
+        return None
+    snapshot = {
+        'job_id': job.pk,
+        'name': job.name,
+        'queue': job.queue,
+        'state': job.state,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at,
+        'progress': job.events.count(),
+    }
+    if job.state == 'SUCCESS':
+        snapshot['result'] = job.result
+    elif job.state == 'FAILURE':
+        snapshot['error'] = job.error
+    return snapshot
+
+
+def job_events(job_id, after=0, heartbeat=15, max_duration=None):
+    """
+    Yield ('progress', event_id, event) as events arrive, then ('done', None, final_state)
+
+    Starts after event id `after`, so a client can resume where it left off.
+    Yields None every `heartbeat` seconds without news so callers can keep
+    the connection alive, and simply stops once `max_duration` seconds have
+    passed. Ends immediately for unknown ids.
+    """
+    started = idle_since = time.monotonic()
+    while True:
+        state = Job.objects.filter(pk=job_id).values_list('state', flat=True).first()
+        if state is None:
+            return
+        new_events = list(
+            JobEvent.objects.filter(job_id=job_id, id__gt=after).order_by('id').values_list('id', 'payload')
+        )
+        for event_id, payload in new_events:
+            yield 'progress', event_id, payload
+            after = event_id
+        # The dispatcher flushes events before writing the final state
+        if state in FINISHED_STATES:
+            yield 'done', None, job_status(job_id)
+            return
+        now = time.monotonic()
+        if max_duration is not None and now - started >= max_duration:
+            return
+        if new_events:
+            idle_since = now
+        elif now - idle_since >= heartbeat:
+            idle_since = now
+            yield None
+        time.sleep(TICK)
+
+
+def run_scraper_task():
+    scraped_data, total_scraped = run_scraper()
+    saved_items = save_to_db(scraped_data)
+    return {
+        'scraped_count': total_scraped,
+        'saved_to_db': len(saved_items),
+    }
+
+
+def process_unprocessed_news_task(batch_size=20, parallel=True, max_workers=4, high_priority_first=True):
+    if high_priority_first:
+        return process_high_priority_first(
+            batch_size=batch_size, max_workers=max_workers, on_progress=report_progress
+        )
+    return process_unprocessed_news(
+        batch_size=batch_size, parallel=parallel, max_workers=max_workers, on_progress=report_progress
+    )
+
+
+def scrape_and_process_task(max_workers=4, high_priority_first=True):
+    """Scrape, then run the LLM over exactly as many items as were saved"""
+    scraping = run_scraper_task()
+    processing = process_unprocessed_news_task(
+        batch_size=scraping['saved_to_db'],
+        max_workers=max_workers,
+        high_priority_first=high_priority_first,
+    )
+    return {'scraping': scraping, 'processing': processing}
+
+
+def agentic_analysis_task(hours=24, model='llama3'):
+    return run_agentic_news_analysis(hours=hours, model=model)
+
+
+def scrape_and_agentic_analysis_task(hours=24, model='llama3'):
+    scraped_data, total_scraped = run_scraper()
+    scrape_count = len(save_to_db(scraped_data))
+    if scrape_count == 0:
+        logger.warning("No new articles scraped (all duplicates), analyzing existing articles...")
+    return {
+        'scraping': {
+            'total_found': total_scraped,
+            'new_saved': scrape_count,
+            'duplicates_skipped': total_scraped - scrape_count
+        },
+        'agentic_analysis': run_agentic_news_analysis(hours=hours, model=model),
+    }
+
+
+TASKS = {
+    func.__name__: func
+    for func in (
+        run_scraper_task,
+        process_unprocessed_news_task,
+        scrape_and_process_task,
+        agentic_analysis_task,
+        scrape_and_agentic_analysis_task,
+    )
+}
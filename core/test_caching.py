@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import CacheHandler, cache
+from django.db import connection
+from django.test import TestCase
+
+from .models import NewsItem
+from .views import invalidate_news_caches
+
+
+def other_process_cache():
+    """A cache connection built from settings alone, like another worker's"""
+    return CacheHandler().create_connection('default')
+
+
+def stored_keys():
+    """Keys physically in the shared cache table, as any process would see them"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT cache_key FROM {settings.CACHES['default']['LOCATION']}")
+        return {row[0].split(':', 2)[-1] for row in cursor.fetchall()}
+
+
+class SharedCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        NewsItem.objects.create(source='example', url='https://example.com/a', title='First', summary='One.')
+
+    def add_item(self, n):
+        # A write that skips invalidation, like a row saved by another process
+        NewsItem.objects.create(source='example', url=f'https://example.com/{n}', title=f'Item {n}', summary='More.')
+
+    def test_stats_and_dashboard_invalidation_reaches_every_process(self):
+        self.assertEqual(self.client.get('/core/processing-stats/').data['total_news'], 1)
+        self.assertEqual(self.client.get('/core/dashboard-summary/').data['unprocessed_count'], 1)
+
+        self.add_item(2)
+        self.assertEqual(self.client.get('/core/processing-stats/').data['total_news'], 1)
+
+        # Invalidating through a separate connection is what a job in another worker does
+        self.assertIn('processing_stats', stored_keys())
+        other = other_process_cache()
+        other.delete_many(['processing_stats', 'dashboard_summary'])
+
+        self.assertEqual(self.client.get('/core/processing-stats/').data['total_news'], 2)
+        self.assertEqual(self.client.get('/core/dashboard-summary/').data['unprocessed_count'], 2)
+
+    def test_list_pages_are_served_from_cache_until_invalidated(self):
+        response = self.client.get('/core/news/all/')
+        etag = response['ETag']
+        self.assertEqual(response.data['count'], 1)
+
+        self.assertTrue(any(key.startswith('news_list:') for key in stored_keys()))
+
+        self.add_item(2)
+        cached = self.client.get('/core/news/all/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+
+        # A job finishing in another worker swaps the generation token there
+        with mock.patch('core.views.cache', other_process_cache()):
+            invalidate_news_caches()
+
+        fresh = self.client.get('/core/news/all/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(fresh.status_code, 200)
+        self.assertEqual(fresh.data['count'], 2)
+        self.assertNotEqual(fresh['ETag'], etag)
+
+    def test_api_write_invalidates_list_pages(self):
+        item = NewsItem.objects.get()
+        self.assertEqual(self.client.get('/core/news/all/').data['results'][0]['priority'], 1)
+
+        self.client.patch(f'/core/news/{item.pk}/update-priority/', {'priority': 7}, content_type='application/json')
+        self.assertEqual(self.client.get('/core/news/all/').data['results'][0]['priority'], 7)
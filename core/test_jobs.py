@@ -0,0 +1,116 @@
+import queue
+from datetime import timedelta
+from unittest import mock
+
+from django.db import IntegrityError
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from . import tasks
+from .models import Job
+
+
+class JobQueueTests(TestCase):
+
+    def run_claimed(self, job):
+        """What a dispatcher does with a claimed job, minus the threads"""
+        events = queue.SimpleQueue()
+        fields = tasks._run_job(job, events)
+        tasks._flush_events(job, events)
+        tasks._finish(job, fields)
+
+    def test_job_state_lives_in_the_database(self):
+        job_id = tasks.enqueue('scrape', 'scrape', tasks.run_scraper_task)
+
+        # Any process can answer for the job, not just the one that queued it
+        self.assertEqual(Job.objects.get(pk=job_id).state, 'PENDING')
+        self.assertEqual(tasks.job_status(job_id)['state'], 'PENDING')
+        self.assertIsNone(tasks.job_status('missing'))
+
+    def test_one_started_job_per_queue(self):
+        first = tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=1)
+        second = tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=2)
+        other = tasks.enqueue('scrape', 'scrape', tasks.run_scraper_task)
+
+        self.assertEqual(tasks._claim('llm').pk, first)
+        self.assertIsNone(tasks._claim('llm'))
+        self.assertEqual(tasks._claim('scrape').pk, other)
+
+        # A worker that stopped heartbeating gives its queue back
+        Job.objects.filter(pk=first).update(heartbeat_at=timezone.now() - tasks.STALE_AFTER - timedelta(seconds=1))
+        self.assertEqual(tasks._claim('llm').pk, second)
+        self.assertEqual(tasks.job_status(first)['state'], 'FAILURE')
+
+    def test_database_allows_one_started_job_per_queue(self):
+        first = tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=1)
+        second = tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=2)
+        self.assertEqual(tasks._claim('llm').pk, first)
+
+        with self.assertRaises(IntegrityError):
+            Job.objects.filter(pk=second).update(state='STARTED')
+
+    def test_claim_loses_race_to_another_process(self):
+        tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=1)
+        tasks.enqueue('llm', 'agentic-analysis', tasks.agentic_analysis_task, hours=2)
+        tasks._claim('llm')
+
+        # Both pre-checks pass as if the other claim landed after they ran
+        with mock.patch.object(QuerySet, 'exists', side_effect=[True, False]):
+            self.assertIsNone(tasks._claim('llm'))
+        self.assertEqual(Job.objects.filter(state='STARTED').count(), 1)
+
+    @mock.patch('core.tasks.process_high_priority_first')
+    def test_result_and_progress_are_recorded(self, process):
+        def fake_process(batch_size, max_workers, on_progress):
+            on_progress({'success': True, 'id': 1})
+            on_progress({'success': False, 'reason': 'no_url'})
+            return {'total': 2, 'processed': 1}
+        process.side_effect = fake_process
+
+        job_id = tasks.enqueue('llm', 'process-news', tasks.process_unprocessed_news_task, batch_size=2)
+        self.run_claimed(tasks._claim('llm'))
+
+        status = tasks.job_status(job_id)
+        self.assertEqual(status['state'], 'SUCCESS')
+        self.assertEqual(status['result'], {'total': 2, 'processed': 1})
+        self.assertEqual(status['progress'], 2)
+        messages = list(tasks.job_events(job_id))
+        self.assertEqual([kind for kind, _, _ in messages], ['progress', 'progress', 'done'])
+
+        # A reconnecting stream resumes after the last event it saw
+        first_id = messages[0][1]
+        resumed = list(tasks.job_events(job_id, after=first_id))
+        self.assertEqual([payload for _, _, payload in resumed][:1], [{'success': False, 'reason': 'no_url'}])
+
+    def test_failures_are_recorded(self):
+        job_id = tasks.enqueue('scrape', 'scrape', tasks.run_scraper_task)
+        with mock.patch('core.tasks.run_scraper', side_effect=RuntimeError('feeds down')), \
+                self.assertLogs('core.tasks', 'ERROR'):
+            self.run_claimed(tasks._claim('scrape'))
+
+        status = tasks.job_status(job_id)
+        self.assertEqual(status['state'], 'FAILURE')
+        self.assertEqual(status['error'], 'feeds down')
+
+    def test_unregistered_functions_are_rejected(self):
+        with self.assertRaises(ValueError):
+            tasks.enqueue('llm', 'anything', print)
+
+    def test_stream_stops_after_max_duration(self):
+        job_id = tasks.enqueue('scrape', 'scrape', tasks.run_scraper_task)
+        with mock.patch('core.tasks.TICK', 0):
+            self.assertEqual(list(tasks.job_events(job_id, heartbeat=60, max_duration=0)), [])
+
+    @mock.patch('core.tasks.run_agentic_news_analysis', return_value={'success': True, 'top_items': []})
+    @mock.patch('core.tasks.save_to_db', return_value=[])
+    @mock.patch('core.tasks.run_scraper', return_value=({}, 0))
+    def test_combined_endpoints_queue_persisted_jobs(self, _scrape, _save, _analyse):
+        for path in ('/core/scrape-and-process/', '/core/agentic-analysis/', '/core/scrape-and-analyze/'):
+            response = self.client.post(path, {}, content_type='application/json')
+            self.assertEqual(response.status_code, 202)
+            job_id = response.json()['job_id']
+            self.assertEqual(self.client.get(f'/core/jobs/{job_id}/').json()['state'], 'PENDING')
+
+            self.run_claimed(tasks._claim('llm'))
+            self.assertEqual(self.client.get(f'/core/jobs/{job_id}/').json()['state'], 'SUCCESS')
@@ -0,0 +1,57 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+
+from .ai_processor import process_unprocessed_news
+from .models import NewsItem
+
+AI_RESULT = {
+    'ai_summary': 'Summary of the advisory.',
+    'risk_level': 'high',
+    'risk_score': 8,
+    'risk_reason': 'Actively exploited.',
+}
+
+
+class SequentialProcessingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.item = NewsItem.objects.create(
+            source='example', url='https://example.com/a', title='Zero-day in VPN appliance',
+            summary='A zero-day is being exploited.',
+        )
+
+    @mock.patch('core.ai_processor.generate_ai_summary_with_ollama', return_value=AI_RESULT)
+    @mock.patch('core.ai_processor.extract_article_content', return_value='Exploit details. ' * 20)
+    def test_processing_one_item_changes_list_etag(self, _extract, _generate):
+        etag = self.client.get('/core/news/all/')['ETag']
+
+        # A single item takes the sequential path
+        result = process_unprocessed_news(batch_size=1, use_cache=False)
+        self.assertEqual(result['processed'], 1)
+        cache.clear()
+
+        response = self.client.get('/core/news/all/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['results'][0]['risk_level'], 'high')
+
+
+class ParallelProcessingTests(TransactionTestCase):
+    # The async path writes from a worker thread, so rows must be committed
+
+    def test_failed_items_are_written_without_lazy_loads(self):
+        NewsItem.objects.bulk_create([
+            NewsItem(source='example', url=None, title=f'Advisory {i}', summary='No link.')
+            for i in range(6)
+        ])
+
+        # Reading a deferred column back goes through refresh_from_db, one SELECT each
+        with mock.patch.object(NewsItem, 'refresh_from_db', autospec=True,
+                               side_effect=NewsItem.refresh_from_db) as refresh:
+            result = process_unprocessed_news(batch_size=6, max_workers=2, use_cache=False)
+        self.assertEqual(result['skipped'], 6)
+        self.assertEqual(refresh.call_count, 0)
+        self.assertEqual(NewsItem.objects.filter(processed_by_llm=True, ai_summary='No URL available.').count(), 6)
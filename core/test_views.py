@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import NewsItem
+
+
+def make_item(n, age=timedelta(0), **fields):
+    item = NewsItem.objects.create(
+        source='example', url=f'https://example.com/{n}', title=f'Item {n}', summary='Text.', **fields
+    )
+    if age:
+        NewsItem.objects.filter(pk=item.pk).update(created_at=timezone.now() - age)
+    return item
+
+
+class CleanOldNewsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_deletes_only_old_rows_skipping_empty_days(self):
+        make_item(1, timedelta(days=730))
+        make_item(2, timedelta(days=40))
+        make_item(3, timedelta(days=1))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/core/news/clean-old/', {'days': '30'}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['deleted_items'], 2)
+        self.assertEqual(list(NewsItem.objects.values_list('title', flat=True)), ['Item 3'])
+        # One DELETE per day that actually has old rows, not one per calendar day
+        deletes = [q for q in queries.captured_queries if q['sql'].startswith('DELETE FROM "core_newsitem"')]
+        self.assertEqual(len(deletes), 2)
+
+    def test_rejects_bad_days(self):
+        make_item(1, timedelta(days=730))
+        for days in ('abc', 0, -5, None, 10 ** 9):
+            response = self.client.post('/core/news/clean-old/', {'days': days}, content_type='application/json')
+            self.assertEqual(response.status_code, 400, days)
+        self.assertEqual(NewsItem.objects.count(), 1)
+
+
+class UpdatePriorityTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.item = make_item(1)
+
+    def patch(self, pk, priority):
+        return self.client.patch(f'/core/news/{pk}/update-priority/', {'priority': priority},
+                                 content_type='application/json')
+
+    def test_rejects_bad_priority_without_touching_the_row(self):
+        for priority in (None, 'high', [3], 0, 11):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.patch(self.item.pk, priority)
+            self.assertEqual(response.status_code, 400, priority)
+            self.assertFalse([q for q in queries.captured_queries if 'core_newsitem' in q['sql']], priority)
+
+    def test_updates_priority_and_timestamp(self):
+        before = self.item.updated_at
+        response = self.patch(self.item.pk, 7)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data']['priority'], 7)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.priority, 7)
+        self.assertGreater(self.item.updated_at, before)
+
+    def test_unchanged_priority_writes_nothing(self):
+        before = self.item.updated_at
+        response = self.patch(self.item.pk, self.item.priority)
+        self.assertEqual(response.status_code, 200)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.updated_at, before)
+
+    def test_missing_item_is_404(self):
+        self.assertEqual(self.patch(self.item.pk + 100, 5).status_code, 404)
@@ -13,16 +13,22 @@ from core.agentic_processor import run_agentic_news_analysis, get_agent_top_10
 from core.models import NewsItem
 from django.utils import timezone
 from datetime import timedelta
+from functools import lru_cache
 import json
 
 
+@lru_cache(maxsize=1)
+def _client():
+    """One Ollama client for the whole test run"""
+    from ollama import Client
+    return Client(host="http://localhost:11434", timeout=10)
+
+
 def test_ollama_connection():
     """Test if Ollama is responding"""
     print("\n🔍 Testing Ollama connection...")
     try:
-        from ollama import Client
-        client = Client(host="http://localhost:11434", timeout=10)
-        response = client.chat(
+        response = _client().chat(
             model="llama3",
             messages=[{"role": "user", "content": "Hello, respond with just 'OK'"}],
             options={"num_predict": 10}
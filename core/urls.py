@@ -22,6 +22,8 @@ urlpatterns = [
     
     # Processing
     path('process-news/', views.process_news_api, name='process-news'),
+    path('jobs/<str:job_id>/', views.job_status_api, name='job-status'),
+    path('jobs/<str:job_id>/stream/', views.job_stream, name='job-stream'),
     
     # Statistics & Dashboard
     path('processing-stats/', views.processing_stats_api, name='processing-stats'),
@@ -1,26 +1,184 @@
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import api_view
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from django.utils import timezone
 from datetime import timedelta
-from django.db import connection
-from django.db.models import Q
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
 from .models import NewsItem
-from .serializers import NewsItemSerializer
+from .serializers import NewsItemListSerializer, NewsItemSerializer
 from .ai_processor import (
-    process_unprocessed_news, 
     reprocess_news_item,
-    process_high_priority_first,
     clear_content_cache
 )
-from .scraper import run_scraper, save_to_db
-from .agentic_processor import run_agentic_news_analysis, get_agent_top_10
+from .agentic_processor import get_agent_top_10
+from .tasks import (
+    enqueue,
+    job_events,
+    job_status,
+    run_scraper_task,
+    process_unprocessed_news_task,
+    scrape_and_process_task,
+    agentic_analysis_task,
+    scrape_and_agentic_analysis_task,
+)
+import hashlib
+import json
 import logging
+import time
+import uuid
+from functools import wraps
+
 logger = logging.getLogger(__name__)
 
+# Columns loaded for list endpoints; content and ai_summary stay in the DB
+LIST_FIELDS = NewsItemListSerializer.Meta.fields
+
+
+def requested_list_fields(request):
+    """Columns named in ?fields=title,risk_level (limited to LIST_FIELDS)"""
+    requested = request.query_params.get('fields')
+    if not requested:
+        return LIST_FIELDS
+    wanted = {field.strip() for field in requested.split(',')}
+    return [field for field in LIST_FIELDS if field in wanted] or LIST_FIELDS
+
+
+# ?ordering= keys the list views accept; anything else (content, say) is
+# ignored rather than turned into a sort over an unindexed column
+ORDERING_FIELDS = frozenset(
+    prefix + field for field in ('risk_score', 'priority', 'created_at') for prefix in ('', '-')
+)
+RISK_LEVELS = frozenset(value for value, _ in NewsItem._meta.get_field('risk_level').choices)
+
+
+def requested_ordering(request, default):
+    """Sort keys named in ?ordering=-risk_score,priority (limited to ORDERING_FIELDS)"""
+    requested = request.query_params.get('ordering')
+    if not requested:
+        return default
+    keys = (key.strip() for key in requested.split(','))
+    return [key for key in keys if key in ORDERING_FIELDS] or default
+
+
+def filter_risk_level(request, queryset):
+    """Apply ?risk_level=; a level that doesn't exist matches nothing without a query"""
+    risk_level = request.query_params.get('risk_level')
+    if not risk_level:
+        return queryset
+    risk_level = risk_level.strip().lower()
+    if risk_level not in RISK_LEVELS:
+        return queryset.none()
+    return queryset.filter(risk_level=risk_level)
+
+
+# Dashboards poll these endpoints; a few seconds of staleness is fine
+STATS_CACHE_KEY = 'processing_stats'
+STATS_CACHE_TTL = 15
+DASHBOARD_CACHE_KEY = 'dashboard_summary'
+DASHBOARD_CACHE_TTL = 30
+
+
+# List pages are cached under a generation token; replacing the token
+# retires every cached page at once without a key scan
+NEWS_LIST_CACHE_TTL = 30
+NEWS_LIST_GENERATION_KEY = 'news_list_generation'
+NEWS_LAST_WRITE_KEY = 'news_last_write'
+
+# A job stream holds a sync worker; cap each connection and let the client
+# reconnect (and resume) instead
+JOB_STREAM_MAX_SECONDS = 120
+JOB_STREAM_RETRY_MS = 2000
+
+
+def invalidate_news_caches():
+    """Drop cached stats, dashboard and list pages after anything that adds, removes or reprocesses news"""
+    cache.delete_many([STATS_CACHE_KEY, DASHBOARD_CACHE_KEY])
+    cache.set(NEWS_LIST_GENERATION_KEY, uuid.uuid4().hex, None)
+    # Deletes leave no updated_at behind, so Last-Modified also looks here
+    cache.set(NEWS_LAST_WRITE_KEY, time.time(), None)
+
+
+def conditional_list_response(view):
+    """
+    Answer conditional GETs on a list view with 304 before it runs
+
+    The ETag changes whenever any row is added, removed or saved and differs
+    per URL; Last-Modified is the newest updated_at or last recorded write.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        state = NewsItem.objects.aggregate(latest=Max('updated_at'), count=Count('id'))
+        key = f"{state['latest']}|{state['count']}|{request.get_full_path()}"
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+        
+        stamps = [cache.get(NEWS_LAST_WRITE_KEY, 0)]
+        if state['latest'] is not None:
+            stamps.append(state['latest'].timestamp())
+        last_modified = int(max(stamps)) or None
+        
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+        
+        response = view(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+    return wrapper
+
+
+def cached_list_response(view):
+    """
+    Serve a list view's 200 responses from cache, keyed by the full URL
+
+    Validators are replayed too, so a matching If-None-Match or
+    If-Modified-Since gets its 304 without touching the DB.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        generation = cache.get_or_set(NEWS_LIST_GENERATION_KEY, uuid.uuid4().hex, None)
+        url_hash = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+        key = f"news_list:{generation}:{url_hash}"
+        
+        cached = cache.get(key)
+        if cached is not None:
+            data, validators = cached
+            not_modified = get_conditional_response(
+                request,
+                etag=validators.get('ETag'),
+                last_modified=parse_http_date_safe(validators.get('Last-Modified')),
+            )
+            if not_modified is not None:
+                return not_modified
+            response = Response(data, status=status.HTTP_200_OK)
+            for header, value in validators.items():
+                response[header] = value
+            return response
+        
+        response = view(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and hasattr(response, 'data'):
+            validators = {
+                header: response[header]
+                for header in ('ETag', 'Last-Modified') if response.has_header(header)
+            }
+            cache.set(key, (response.data, validators), NEWS_LIST_CACHE_TTL)
+        return response
+    return wrapper
+
+
 # Custom pagination
 class NewsItemPagination(PageNumberPagination):
     page_size = 20
@@ -28,7 +186,32 @@ class NewsItemPagination(PageNumberPagination):
     max_page_size = 100
 
 
+# Keyset pagination, opted into with ?pagination=cursor: every page is an
+# index range scan no matter how deep, instead of an ever-growing OFFSET
+class NewsCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = '-created_at'
+
+
+def news_paginator(request, queryset, fields, cursor_ordering):
+    """
+    Paginator for a list view and the queryset to hand it
+
+    Cursor pages always follow `cursor_ordering` (the view's default order);
+    the column they key on is added to the loaded fields.
+    """
+    if request.query_params.get('pagination') != 'cursor':
+        return NewsItemPagination(), queryset
+    paginator = NewsCursorPagination()
+    paginator.ordering = cursor_ordering
+    return paginator, queryset.only(*fields, cursor_ordering[0].lstrip('-'))
+
+
 @api_view(['GET'])
+@cached_list_response
+@conditional_list_response
 def processed_news_list(request):
     """
     GET /api/news/processed/
@@ -41,10 +224,13 @@ def processed_news_list(request):
     - min_priority: minimum priority (e.g., 5 for high priority only)
     - page: page number
     - page_size: items per page (default: 20)
+    - pagination: "cursor" for keyset pages in the default order (ignores ordering/page)
+    - fields: comma-separated columns to return (e.g. id,title,risk_level)
     """
     try:
+        fields = requested_list_fields(request)
         # Start with processed news
-        queryset = NewsItem.objects.filter(processed_by_llm=True)
+        queryset = NewsItem.objects.filter(processed_by_llm=True).only(*fields)
         
         # Filter by priority
         priority = request.query_params.get('priority')
@@ -57,9 +243,7 @@ def processed_news_list(request):
             queryset = queryset.filter(priority__gte=int(min_priority))
         
         # Filter by risk level
-        risk_level = request.query_params.get('risk_level')
-        if risk_level:
-            queryset = queryset.filter(risk_level=risk_level.lower())
+        queryset = filter_risk_level(request, queryset)
         
         # Search functionality
         search = request.query_params.get('search')
@@ -71,21 +255,18 @@ def processed_news_list(request):
             )
         
         # Ordering (default: -risk_score, -priority)
-        ordering = request.query_params.get('ordering', '-risk_score,-priority')
-        ordering_fields = [field.strip() for field in ordering.split(',')]
-        queryset = queryset.order_by(*ordering_fields)
+        queryset = queryset.order_by(*requested_ordering(request, ('-risk_score', '-priority')))
         
         # Pagination
-        paginator = NewsItemPagination()
+        paginator, queryset = news_paginator(
+            request, queryset, fields, ('-risk_score', '-priority', '-created_at')
+        )
         page = paginator.paginate_queryset(queryset, request)
         
-        if page is not None:
-            serializer = NewsItemSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        # Fallback without pagination
-        serializer = NewsItemSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Both paginators have a page_size, so a page always comes back and
+        # there is no path that serializes the whole table
+        serializer = NewsItemListSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
         
     except Exception as e:
         return Response({
@@ -94,6 +275,8 @@ def processed_news_list(request):
 
 
 @api_view(['GET'])
+@cached_list_response
+@conditional_list_response
 def all_news_list(request):
     """
     GET /api/news/all/
@@ -104,9 +287,12 @@ def all_news_list(request):
     - processed: true/false (filter by processing status)
     - search: search in title, summary
     - ordering: sort by field (default: -created_at)
+    - pagination: "cursor" for keyset pages by -created_at (ignores ordering/page)
+    - fields: comma-separated columns to return
     """
     try:
-        queryset = NewsItem.objects.all()
+        fields = requested_list_fields(request)
+        queryset = NewsItem.objects.only(*fields)
         
         # Filter by priority
         priority = request.query_params.get('priority')
@@ -133,20 +319,14 @@ def all_news_list(request):
             )
         
         # Ordering
-        ordering = request.query_params.get('ordering', '-created_at')
-        ordering_fields = [field.strip() for field in ordering.split(',')]
-        queryset = queryset.order_by(*ordering_fields)
+        queryset = queryset.order_by(*requested_ordering(request, ('-created_at',)))
         
-        # Pagination
-        paginator = NewsItemPagination()
+        # Always paginated: both paginators have a page_size, so there is no
+        # path that serializes the whole table
+        paginator, queryset = news_paginator(request, queryset, fields, ('-created_at',))
         page = paginator.paginate_queryset(queryset, request)
-        
-        if page is not None:
-            serializer = NewsItemSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = NewsItemSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = NewsItemListSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
         
     except Exception as e:
         return Response({
@@ -155,6 +335,8 @@ def all_news_list(request):
 
 
 @api_view(['GET'])
+@cached_list_response
+@conditional_list_response
 def high_priority_news_list(request):
     """
     GET /api/news/high-priority/
@@ -163,10 +345,11 @@ def high_priority_news_list(request):
     Ordered by: priority DESC, risk_score DESC, created_at DESC
     """
     try:
+        fields = requested_list_fields(request)
         queryset = NewsItem.objects.filter(
             processed_by_llm=True,
             priority__gte=5
-        ).order_by('-priority', '-risk_score', '-created_at')
+        ).only(*fields).order_by('-priority', '-risk_score', '-created_at')
         
         # Search
         search = request.query_params.get('search')
@@ -177,20 +360,14 @@ def high_priority_news_list(request):
             )
         
         # Risk level filter
-        risk_level = request.query_params.get('risk_level')
-        if risk_level:
-            queryset = queryset.filter(risk_level=risk_level.lower())
+        queryset = filter_risk_level(request, queryset)
         
         # Pagination
         paginator = NewsItemPagination()
         page = paginator.paginate_queryset(queryset, request)
         
-        if page is not None:
-            serializer = NewsItemSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = NewsItemSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = NewsItemListSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
         
     except Exception as e:
         return Response({
@@ -199,6 +376,8 @@ def high_priority_news_list(request):
 
 
 @api_view(['GET'])
+@cached_list_response
+@conditional_list_response
 def critical_news_list(request):
     """
     GET /api/news/critical/
@@ -206,20 +385,17 @@ def critical_news_list(request):
     Get only critical risk level news
     """
     try:
+        fields = requested_list_fields(request)
         queryset = NewsItem.objects.filter(
             processed_by_llm=True,
             risk_level='critical'
-        ).order_by('-risk_score', '-created_at')
+        ).only(*fields).order_by('-risk_score', '-created_at')
         
         paginator = NewsItemPagination()
         page = paginator.paginate_queryset(queryset, request)
         
-        if page is not None:
-            serializer = NewsItemSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = NewsItemSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = NewsItemListSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
         
     except Exception as e:
         return Response({
@@ -228,6 +404,8 @@ def critical_news_list(request):
 
 
 @api_view(['GET'])
+@cached_list_response
+@conditional_list_response
 def news_by_priority(request, priority_level):
     """
     GET /api/news/priority/{priority_level}/
@@ -235,19 +413,16 @@ def news_by_priority(request, priority_level):
     Get news filtered by specific priority level (1-10)
     """
     try:
+        fields = requested_list_fields(request)
         queryset = NewsItem.objects.filter(
             priority=priority_level
-        ).order_by('-risk_score', '-created_at')
+        ).only(*fields).order_by('-risk_score', '-created_at')
         
         paginator = NewsItemPagination()
         page = paginator.paginate_queryset(queryset, request)
         
-        if page is not None:
-            serializer = NewsItemSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = NewsItemSerializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = NewsItemListSerializer(page, many=True, fields=fields)
+        return paginator.get_paginated_response(serializer.data)
         
     except Exception as e:
         return Response({
@@ -284,38 +459,42 @@ def update_news_priority(request, pk):
     
     Body: {"priority": 8}
     """
+    priority = request.data.get('priority')
+    if priority is None:
+        return Response({
+            'error': 'Priority value is required'
+        }, status=status.HTTP_400_BAD_REQUEST)
     try:
-        news_item = NewsItem.objects.get(pk=pk)
-        priority = request.data.get('priority')
-        
-        if priority is None:
-            return Response({
-                'error': 'Priority value is required'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
         priority = int(priority)
-        if priority < 1 or priority > 10:
-            return Response({
-                'error': 'Priority must be between 1 and 10'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        news_item.priority = priority
-        news_item.save()
-        
+    except (TypeError, ValueError):
+        return Response({
+            'error': 'Invalid priority value'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    if priority < 1 or priority > 10:
+        return Response({
+            'error': 'Priority must be between 1 and 10'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        # A single UPDATE that matches no row when the priority is unchanged;
+        # update() bypasses auto_now, so updated_at is set here
+        changed = NewsItem.objects.filter(pk=pk).exclude(priority=priority).update(
+            priority=priority, updated_at=timezone.now()
+        )
+        if changed:
+            invalidate_news_caches()
+
+        news_item = NewsItem.objects.get(pk=pk)
         serializer = NewsItemSerializer(news_item)
         return Response({
             'message': 'Priority updated successfully',
             'data': serializer.data
         }, status=status.HTTP_200_OK)
-        
+
     except NewsItem.DoesNotExist:
         return Response({
             'error': 'News item not found'
         }, status=status.HTTP_404_NOT_FOUND)
-    except ValueError:
-        return Response({
-            'error': 'Invalid priority value'
-        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response({
             'error': str(e)
@@ -327,17 +506,15 @@ def run_scraper_view(request):
     """
     POST /api/scrape/
     
-    Scrape news from configured sources
+    Queue a scrape of the configured sources; poll /api/jobs/{job_id}/
     """
     try:
-        scraped_data = run_scraper()
-        saved_items = save_to_db(scraped_data)
+        job_id = enqueue('scrape', 'scrape', run_scraper_task)
 
         return Response({
-            "message": "Scraping completed successfully.",
-            "scraped_count": sum(len(v) for v in scraped_data.values()),
-            "saved_to_db": len(saved_items),
-        }, status=status.HTTP_200_OK)
+            "message": "Scraping queued.",
+            "job_id": job_id,
+        }, status=status.HTTP_202_ACCEPTED)
 
     except Exception as e:
         return Response({
@@ -353,11 +530,30 @@ def delete_all_news(request):
     Delete all news items and reset counter
     """
     try:
-        deleted_count, _ = NewsItem.objects.all().delete()
-        with connection.cursor() as cursor:
-            cursor.execute("DELETE FROM sqlite_sequence WHERE name='core_newsitem';")
+        # Raw SQL skips the ORM collector: nothing references NewsItem and a
+        # wipe should not fan out per-row delete signals
+        table = connection.ops.quote_name(NewsItem._meta.db_table)
+        # The wipe and the id counter reset commit together or not at all
+        with transaction.atomic(), connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                deleted_count = NewsItem.objects.count()
+                cursor.execute(f"TRUNCATE {table} RESTART IDENTITY CASCADE;")
+            else:
+                cursor.execute(f"DELETE FROM {table};")
+                deleted_count = cursor.rowcount
+                if connection.vendor == 'sqlite':
+                    cursor.execute("DELETE FROM sqlite_sequence WHERE name=%s;", [NewsItem._meta.db_table])
+
+        if connection.vendor == 'sqlite':
+            # Give the freed pages back to the filesystem (VACUUM cannot run in
+            # a transaction); under WAL the rewrite lands in the log until it
+            # is checkpointed
+            with connection.cursor() as cursor:
+                cursor.execute("VACUUM;")
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE);")
 
         clear_content_cache()
+        invalidate_news_caches()
 
         return Response({
             "message": "All news deleted successfully.",
@@ -378,9 +574,30 @@ def clean_old_news(request):
     Body (optional): {"days": 30}
     """
     try:
-        days = request.data.get("days", 30)
+        days = int(request.data.get("days", 30))
+        if days < 1:
+            raise ValueError(days)
         cutoff_date = timezone.now() - timedelta(days=days)
-        deleted_count, _ = NewsItem.objects.filter(created_at__lt=cutoff_date).delete()
+    except (TypeError, ValueError, OverflowError):
+        return Response({
+            "error": "days must be a positive integer"
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        old_news = NewsItem.objects.filter(created_at__lt=cutoff_date)
+
+        # Delete a day at a time so no single statement holds the write lock
+        # for long; raw deletes are safe since nothing references NewsItem
+        deleted_count = 0
+        lo = old_news.aggregate(earliest=Min('created_at'))['earliest']
+        while lo is not None:
+            hi = min(lo + timedelta(days=1), cutoff_date)
+            with transaction.atomic():
+                window = NewsItem.objects.filter(created_at__gte=lo, created_at__lt=hi)
+                deleted_count += window._raw_delete(window.db)
+            # Jump straight to the next old row so empty days cost nothing
+            lo = old_news.filter(created_at__gte=hi).aggregate(earliest=Min('created_at'))['earliest']
+        invalidate_news_caches()
 
         return Response({
             "message": f"Old news deleted successfully.",
@@ -399,6 +616,9 @@ def process_news_api(request):
     """
     POST /api/process-news/
     
+    Queue LLM processing of unprocessed news; poll /api/jobs/{job_id}/
+    or follow /api/jobs/{job_id}/stream/ for per-item progress
+    
     Body (optional):
     {
         "batch_size": 20,
@@ -408,28 +628,19 @@ def process_news_api(request):
     }
     """
     try:
-        batch_size = request.data.get('batch_size', 20)
-        parallel = request.data.get('parallel', True)
-        max_workers = request.data.get('max_workers', 4)
-        high_priority = request.data.get('high_priority_first', True)
-        
-        if high_priority:
-            result = process_high_priority_first(
-                batch_size=batch_size,
-                max_workers=max_workers
-            )
-        else:
-            result = process_unprocessed_news(
-                batch_size=batch_size,
-                parallel=parallel,
-                max_workers=max_workers
-            )
+        job_id = enqueue(
+            'llm', 'process-news', process_unprocessed_news_task,
+            batch_size=request.data.get('batch_size', 20),
+            parallel=request.data.get('parallel', True),
+            max_workers=request.data.get('max_workers', 4),
+            high_priority_first=request.data.get('high_priority_first', True),
+        )
         
         return Response({
             'success': True,
-            'message': 'Processing completed',
-            'result': result
-        }, status=status.HTTP_200_OK)
+            'message': 'Processing queued',
+            'job_id': job_id
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
         return Response({
@@ -438,16 +649,71 @@ def process_news_api(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+def job_status_api(request, job_id):
+    """
+    GET /api/jobs/{job_id}/
+    
+    State of a queued job: PENDING, STARTED, SUCCESS or FAILURE
+    """
+    job = job_status(job_id)
+    if job is None:
+        return Response({
+            'error': 'Job not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    return Response(job, status=status.HTTP_200_OK)
+
+
+@require_GET
+def job_stream(request, job_id):
+    """
+    GET /api/jobs/{job_id}/stream/
+    
+    Server-Sent Events: one `data:` message per finished item, then an
+    `event: done` message carrying the final job state. A plain Django view,
+    since DRF content negotiation would reject `Accept: text/event-stream`.
+    
+    Each connection closes after JOB_STREAM_MAX_SECONDS so it can't pin a
+    worker for a whole agentic run; EventSource reconnects with
+    Last-Event-ID and picks up from the next event.
+    """
+    if job_status(job_id) is None:
+        return JsonResponse({'error': 'Job not found'}, status=404)
+    
+    try:
+        after = int(request.headers.get('Last-Event-ID', 0))
+    except ValueError:
+        after = 0
+    
+    def stream():
+        yield f"retry: {JOB_STREAM_RETRY_MS}\n\n"
+        for message in job_events(job_id, after=after, max_duration=JOB_STREAM_MAX_SECONDS):
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            kind, event_id, payload = message
+            data = json.dumps(payload, cls=DjangoJSONEncoder)
+            if kind == 'progress':
+                yield f"id: {event_id}\ndata: {data}\n\n"
+            else:
+                yield f"event: {kind}\ndata: {data}\n\n"
+    
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # stop nginx from buffering the stream
+    return response
+
+
 @api_view(['POST'])
 def reprocess_news_api(request, pk):
     """
     POST /api/news/{id}/reprocess/
     """
     try:
-        success = reprocess_news_item(pk)
+        news_item = reprocess_news_item(pk)
+        invalidate_news_caches()
         
-        if success:
-            news_item = NewsItem.objects.get(pk=pk)
+        if news_item is not None:
             serializer = NewsItemSerializer(news_item)
             return Response({
                 'success': True,
@@ -460,11 +726,6 @@ def reprocess_news_api(request, pk):
                 'message': 'Failed to reprocess news item'
             }, status=status.HTTP_400_BAD_REQUEST)
             
-    except NewsItem.DoesNotExist:
-        return Response({
-            'success': False,
-            'error': 'News item not found'
-        }, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         return Response({
             'success': False,
@@ -472,6 +733,57 @@ def reprocess_news_api(request, pk):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _build_processing_stats():
+    """Counters behind processing_stats_api"""
+    risk_levels = ['critical', 'high', 'medium', 'low']
+    
+    # Stats tolerate replica lag, so keep these scans off the primary when
+    # a READ_REPLICA_DB alias is configured
+    news = NewsItem.objects.using(getattr(settings, 'READ_REPLICA_DB', 'default'))
+    
+    # One table scan for every counter below
+    counts = news.aggregate(
+        total=Count('id'),
+        processed=Count('id', filter=Q(processed_by_llm=True)),
+        unprocessed=Count('id', filter=Q(processed_by_llm=False)),
+        critical_priority=Count('id', filter=Q(priority__gte=8)),
+        high_priority=Count('id', filter=Q(priority__gte=5, priority__lt=8)),
+        medium_priority=Count('id', filter=Q(priority__gte=3, priority__lt=5)),
+        low_priority=Count('id', filter=Q(priority__lt=3)),
+        **{
+            level: Count('id', filter=Q(processed_by_llm=True, risk_level=level))
+            for level in risk_levels
+        },
+    )
+    total = counts['total']
+    processed = counts['processed']
+    unprocessed = counts['unprocessed']
+    
+    # Risk breakdown
+    risk_breakdown = {level: counts[level] for level in risk_levels}
+    
+    # Priority breakdown
+    priority_breakdown = {
+        key: counts[key]
+        for key in ['critical_priority', 'high_priority', 'medium_priority', 'low_priority']
+    }
+    
+    # Source breakdown (top 5)
+    top_sources = news.values('source').annotate(
+        count=Count('id')
+    ).order_by('-count')[:5]
+    
+    return {
+        'total_news': total,
+        'processed': processed,
+        'unprocessed': unprocessed,
+        'processing_rate': f"{(processed/total*100):.1f}%" if total > 0 else "0%",
+        'risk_breakdown': risk_breakdown,
+        'priority_breakdown': priority_breakdown,
+        'top_sources': list(top_sources)
+    }
+
+
 @api_view(['GET'])
 def processing_stats_api(request):
     """
@@ -480,41 +792,8 @@ def processing_stats_api(request):
     Get comprehensive statistics about news processing
     """
     try:
-        total = NewsItem.objects.count()
-        processed = NewsItem.objects.filter(processed_by_llm=True).count()
-        unprocessed = NewsItem.objects.filter(processed_by_llm=False).count()
-        
-        # Risk breakdown
-        risk_breakdown = {}
-        for level in ['critical', 'high', 'medium', 'low']:
-            risk_breakdown[level] = NewsItem.objects.filter(
-                processed_by_llm=True,
-                risk_level=level
-            ).count()
-        
-        # Priority breakdown
-        priority_breakdown = {
-            'critical_priority': NewsItem.objects.filter(priority__gte=8).count(),
-            'high_priority': NewsItem.objects.filter(priority__gte=5, priority__lt=8).count(),
-            'medium_priority': NewsItem.objects.filter(priority__gte=3, priority__lt=5).count(),
-            'low_priority': NewsItem.objects.filter(priority__lt=3).count(),
-        }
-        
-        # Source breakdown (top 5)
-        from django.db.models import Count
-        top_sources = NewsItem.objects.values('source').annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
-        
-        return Response({
-            'total_news': total,
-            'processed': processed,
-            'unprocessed': unprocessed,
-            'processing_rate': f"{(processed/total*100):.1f}%" if total > 0 else "0%",
-            'risk_breakdown': risk_breakdown,
-            'priority_breakdown': priority_breakdown,
-            'top_sources': list(top_sources)
-        }, status=status.HTTP_200_OK)
+        stats = cache.get_or_set(STATS_CACHE_KEY, _build_processing_stats, STATS_CACHE_TTL)
+        return Response(stats, status=status.HTTP_200_OK)
         
     except Exception as e:
         return Response({
@@ -528,7 +807,7 @@ def scrape_and_process_api(request):
     """
     POST /api/scrape-and-process/
     
-    Combined endpoint: Scrape news then immediately process them
+    Combined job: scrape news then immediately process them; poll /api/jobs/{job_id}/
     
     Body (optional):
     {
@@ -537,35 +816,17 @@ def scrape_and_process_api(request):
     }
     """
     try:
-        # Step 1: Scrape news
-        scraped_data = run_scraper()
-        saved_items = save_to_db(scraped_data)
-        
-        # Step 2: Process the scraped news
-        max_workers = request.data.get('max_workers', 4)
-        high_priority = request.data.get('high_priority_first', True)
-        
-        if high_priority:
-            process_result = process_high_priority_first(
-                batch_size=len(saved_items),
-                max_workers=max_workers
-            )
-        else:
-            process_result = process_unprocessed_news(
-                batch_size=len(saved_items),
-                parallel=True,
-                max_workers=max_workers
-            )
+        job_id = enqueue(
+            'llm', 'scrape-and-process', scrape_and_process_task,
+            max_workers=request.data.get('max_workers', 4),
+            high_priority_first=request.data.get('high_priority_first', True),
+        )
         
         return Response({
             'success': True,
-            'message': 'Scraping and processing completed',
-            'scraping': {
-                'scraped_count': sum(len(v) for v in scraped_data.values()),
-                'saved_to_db': len(saved_items)
-            },
-            'processing': process_result
-        }, status=status.HTTP_200_OK)
+            'message': 'Scraping and processing queued',
+            'job_id': job_id
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
         return Response({
@@ -594,6 +855,38 @@ def clear_cache_api(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _build_dashboard_summary():
+    """Payload behind dashboard_summary"""
+    # Latest critical news; plain dicts skip model instances and DRF field
+    # coercion, and the renderer formats them exactly like the serializer
+    critical_news = NewsItem.objects.filter(
+        risk_level='critical',
+        processed_by_llm=True
+    ).order_by('-created_at').values(*LIST_FIELDS)[:5]
+    
+    # Latest high priority news
+    high_priority = NewsItem.objects.filter(
+        priority__gte=5,
+        processed_by_llm=True
+    ).order_by('-created_at').values(*LIST_FIELDS)[:10]
+    
+    # Recent unprocessed and today's news, in one pass. Today is a plain
+    # range: created_at__date would call SQLite's Python date-cast per row
+    today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+    counts = NewsItem.objects.aggregate(
+        unprocessed=Count('id', filter=Q(processed_by_llm=False)),
+        today=Count('id', filter=Q(created_at__gte=today_start, created_at__lt=today_start + timedelta(days=1))),
+    )
+    
+    return {
+        'critical_news': list(critical_news),
+        'high_priority_news': list(high_priority),
+        'unprocessed_count': counts['unprocessed'],
+        'today_news_count': counts['today'],
+        'last_updated': timezone.now()
+    }
+
+
 @api_view(['GET'])
 def dashboard_summary(request):
     """
@@ -602,34 +895,8 @@ def dashboard_summary(request):
     Get quick dashboard summary for frontend
     """
     try:
-        # Latest critical news
-        critical_news = NewsItem.objects.filter(
-            risk_level='critical',
-            processed_by_llm=True
-        ).order_by('-created_at')[:5]
-        
-        # Latest high priority news
-        high_priority = NewsItem.objects.filter(
-            priority__gte=5,
-            processed_by_llm=True
-        ).order_by('-created_at')[:10]
-        
-        # Recent unprocessed
-        unprocessed_count = NewsItem.objects.filter(processed_by_llm=False).count()
-        
-        # Today's news
-        today = timezone.now().date()
-        today_news = NewsItem.objects.filter(
-            created_at__date=today
-        ).count()
-        
-        return Response({
-            'critical_news': NewsItemSerializer(critical_news, many=True).data,
-            'high_priority_news': NewsItemSerializer(high_priority, many=True).data,
-            'unprocessed_count': unprocessed_count,
-            'today_news_count': today_news,
-            'last_updated': timezone.now()
-        }, status=status.HTTP_200_OK)
+        summary = cache.get_or_set(DASHBOARD_CACHE_KEY, _build_dashboard_summary, DASHBOARD_CACHE_TTL)
+        return Response(summary, status=status.HTTP_200_OK)
         
     except Exception as e:
         return Response({
@@ -643,7 +910,7 @@ def scrape_and_agentic_analysis_api(request):
     """
     POST /api/scrape-and-analyze/
     
-    Complete workflow:
+    Queues the complete workflow; poll /api/jobs/{job_id}/
     1. Scrape latest news from all sources
     2. Run agentic AI analysis to find top 10 most important
     
@@ -665,38 +932,14 @@ def scrape_and_agentic_analysis_api(request):
             hours = int(request.POST.get('hours', 24))
             model = request.POST.get('model', 'llama3')
         
-        logger.info(f"Starting scrape and analyze: hours={hours}, model={model}")
-        
-        # Step 1: Scrape
-        from .scraper import run_scraper, save_to_db
-        logger.info("Step 1: Scraping news...")
-        scraped_data = run_scraper()
-        saved_items = save_to_db(scraped_data)
-        
-        scrape_count = len(saved_items)
-        total_scraped = sum(len(v) for v in scraped_data.values())
-        logger.info(f"Scraped {total_scraped} articles, saved {scrape_count} new ones")
-        
-        # If no new items, still analyze existing items from last X hours
-        if scrape_count == 0:
-            logger.warning("No new articles scraped (all duplicates), analyzing existing articles...")
-        
-        # Step 2: Agentic Analysis
-        from .agentic_processor import run_agentic_news_analysis
-        logger.info("Step 2: Running agentic AI analysis...")
-        
-        analysis_result = run_agentic_news_analysis(hours=hours, model=model)
+        logger.info(f"Queueing scrape and analyze: hours={hours}, model={model}")
+        job_id = enqueue('llm', 'scrape-and-analyze', scrape_and_agentic_analysis_task, hours=hours, model=model)
         
         return Response({
             'success': True,
-            'message': 'Scraping and agentic analysis completed',
-            'scraping': {
-                'total_found': total_scraped,
-                'new_saved': scrape_count,
-                'duplicates_skipped': total_scraped - scrape_count
-            },
-            'agentic_analysis': analysis_result
-        }, status=status.HTTP_200_OK)
+            'message': 'Scraping and agentic analysis queued',
+            'job_id': job_id
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
         logger.exception("Scrape and analyze failed")
@@ -713,7 +956,7 @@ def run_agentic_analysis_api(request):
     """
     POST /api/agentic-analysis/
     
-    Run autonomous AI agent to analyze and prioritize news
+    Queue the autonomous AI agent to analyze and prioritize news; poll /api/jobs/{job_id}/
     Handles JSON, form data, or empty POST
     """
     try:
@@ -725,16 +968,14 @@ def run_agentic_analysis_api(request):
             hours = int(request.POST.get('hours', 24))
             model = request.POST.get('model', 'llama3')
         
-        logger.info(f"Running agentic analysis: hours={hours}, model={model}")
-        
-        from .agentic_processor import run_agentic_news_analysis
-        result = run_agentic_news_analysis(hours=hours, model=model)
+        logger.info(f"Queueing agentic analysis: hours={hours}, model={model}")
+        job_id = enqueue('llm', 'agentic-analysis', agentic_analysis_task, hours=hours, model=model)
         
         return Response({
             'success': True,
-            'message': 'Agentic analysis completed',
-            'result': result
-        }, status=status.HTTP_200_OK)
+            'message': 'Agentic analysis queued',
+            'job_id': job_id
+        }, status=status.HTTP_202_ACCEPTED)
         
     except Exception as e:
         logger.exception("Agentic analysis failed")
@@ -768,10 +1009,7 @@ def get_agent_top_10_api(request):
             if not item.published_date or item.published_date < last_24_hours:
                 continue
 
-            try:
-                risk_details = json.loads(item.risk_reason) if item.risk_reason else {}
-            except:
-                risk_details = {'raw': item.risk_reason}
+            risk_details = item.risk_reason or {}
 
             results.append({
                 'id': item.id,